@@ -1,6 +1,7 @@
-import random
-import sys
+import numpy as np
+from numpy import ndarray
 
+from src.ACO.TourRecord import TourRecord
 from src.Network.FlowNetwork import FlowNetwork
 from src.Network.Solution import Solution
 
@@ -11,17 +12,25 @@ class Ant:
     # =========================================
     # ============== CONSTRUCTOR ==============
     # =========================================
-    def __init__(self, network: FlowNetwork, minTargetFlow: float, alpha: float, beta: float):
+    def __init__(self, network: FlowNetwork, minTargetFlow: float, isPruningDeadEnds=False):
         """Constructor of an Ant instance"""
         # Input Attributes
         self.network = network  # Input network data
         self.minTargetFlow = minTargetFlow  # Target flow to assign
-        self.pheromoneDict = {}  # Dictionary indexed on key (fromNode, toNode, cap) with value (pheromone deposited in previous episodes)
-        self.goodnessDict = {}  # Dictionary indexed on key (fromNode, toNode, cap) with value (eta) (i.e. the "goodness" of taking that arc)
-
-        # Hyperparameters
-        self.alpha = alpha  # alpha = Relative importance to the ant of pheromone over "goodness" of arc
-        self.beta = beta  # beta = Relative importance to the ant of "goodness" of arc over pheromone
+        self.isPruningDeadEnds = isPruningDeadEnds  # Excludes moves into nodes that can no longer reach a sink with capacity
+        self.attractivenessArray = None  # Array indexed on arc number with value (pheromone^alpha * goodness^beta), computed by the colony each episode
+        self.rng = None  # NumPy random generator that the ant draws from, created once per tour from the seed given by the colony
+        self.costToBeat = None  # Cost of the colony's incumbent, which the tour is abandoned at once it cannot beat (NOTE: None never aborts)
+        self.candidateOffsetsArray = None  # Start of each adjacency row's candidate moves, given by the colony each episode (NOTE: None = no candidate lists)
+        self.candidateArcsArray = None  # Each adjacency row's candidate arc numbers (i.e. the arcs of its most attractive edges), laid out by the offsets above
+        # NOTE: Every unit of flow leaves a source and enters a sink, and an open edge costs at least its cheapest parallel arc
+        arcFixedCosts = self.network.arcToFixedCostArray[:self.network.numArcs].reshape(self.network.numEdges, self.network.numArcCaps)
+        arcVariableCosts = self.network.arcToVariableCostArray[:self.network.numArcs].reshape(self.network.numEdges, self.network.numArcCaps)
+        self.edgeMinFixedCostsArray = arcFixedCosts.min(axis=1)  # Cheapest fixed cost among each edge's parallel arcs
+        self.edgeMinVariableCostsArray = arcVariableCosts.min(axis=1)  # Cheapest variable cost among each edge's parallel arcs
+        self.minSourceVariableCost = self.network.arcToVariableCostArray[self.network.sourceArcsOffset:self.network.returnArcsOffset].min()  # Cheapest cost per unit of flow leaving a source
+        self.sinkVariableCostsArray = self.network.arcToVariableCostArray[self.network.sinkArcsOffset:]  # Cost per unit of flow leaving each sink
+        self.minSinkVariableCost = self.sinkVariableCostsArray.min()  # Cheapest cost per unit of flow leaving any sink
 
         # Tour Attributes
         # NOTE: A "tour" is a complete feasible solution that assigns all target flow across the network in a number of trips
@@ -29,26 +38,35 @@ class Ant:
         self.numTrips = 0  # Number of trips the ant has taken
         self.currentPosition = -1  # Node ID of the ant's position- NOTE: -1 Represents the supersource and -2 represents the supersink
         self.remainingFlowToAssign = self.minTargetFlow  # "Mountain" of flow initially at the supersource that the ant has to move
-        self.assignedFlowDict = self.initializeAssignedFlowDict()  # Dictionary indexed on key (fromNode, toNode, cap) with value (cumulative flow assigned)
-        self.availableCapacityDict = self.initializeAvailableCapacityDict()  # Dictionary indexed on key (fromNode, toNode, cap) with value (available capacity until full)
+        self.assignedFlowArray = self.initializeAssignedFlowArray()  # Preallocated array indexed on arc number with value (cumulative flow assigned)
+        self.availableCapacityArray = self.initializeAvailableCapacityArray()  # Preallocated array indexed on arc number with value (available capacity until full)
+        # NOTE: The frontier keeps each adjacency row's non-saturated arcs first, so moves are a slice of the live arcs
+        self.frontierArcsArray = self.network.adjacencyArcsArray.copy()  # Adjacency arcs, partitioned per row into live then saturated
+        self.frontierCountsArray = self.network.adjacencyDegreesArray.copy()  # Number of live (i.e. non-saturated) arcs in each row
+        self.frontierSlotsArray = self.network.arcToSlotArray.copy()  # Position of each arc number in the frontier arcs array
+        # NOTE: The last two entries stand for the supersink (-2) and supersource (-1), which are always kept as moves
+        self.canReachSinkArray = np.ones(self.network.numTotalNodes + 2, dtype=bool)  # Residual reachability of a sink per node
+        self.isReachabilityStale = True  # Set whenever an arc saturates, so the reachability is only recomputed when used
+        self.tourCostBound = 0.0  # Lower bound on the cost of the tour, as of the last trip it was computed after
+        self.isTourAborted = False  # True if the ant abandoned its tour because it could not beat the cost to beat
 
         # Trip Attributes
         # NOTE: A "trip" is a single supersource -> supersink path that assigns only x amount of flow
-        self.tripStack = []  # Maintains the arcs traveled on the current trip (NOTE: Should be treated as a true stack- push/pop only!)
+        self.tripStack = []  # Maintains the arc numbers traveled on the current trip (NOTE: Should be treated as a true stack- push/pop only!)
         self.nodesVisitedThisTrip = set()  # Ant's memory of visited nodes this trip (Used for cycle/backtracking detection)
+        self.hasBacktracked = False  # True once the ant has backtracked on this trip, after which it no longer uses its candidates
 
         # Solution Attributes (Written after an ant completes a tour)
+        # NOTE: The flows of the solution are the assigned flow array, which is netted out in place after the tour
         self.trueCost = 0.0
-        self.sourceFlows = []
-        self.sinkFlows = []
-        self.arcFlows = {}
-        self.arcsOpened = {}
 
-    def findSolution(self, pheromoneDict: dict, goodnessDict: dict) -> None:
+    def findSolution(self, attractivenessArray: ndarray, seed=None, costToBeat=None, candidateLists=None) -> None:
         """Main loop that has the ant explore the graph space until a feasible solution is discovered"""
-        # Update dictionaries for determining edge selection before solving
-        self.pheromoneDict = pheromoneDict  # Dictionary indexed on key (fromNode, toNode, cap) with value (pheromone deposited in previous episodes)
-        self.goodnessDict = goodnessDict  # Dictionary indexed on key (fromNode, toNode, cap) with value (eta) (i.e. the "goodness" of taking that arc)
+        # Update the arc weights for determining edge selection before solving
+        self.attractivenessArray = attractivenessArray
+        self.costToBeat = costToBeat
+        self.candidateOffsetsArray, self.candidateArcsArray = candidateLists if candidateLists is not None else (None, None)
+        self.rng = np.random.default_rng(seed)  # Seed the ant's random stream for this tour (NOTE: None draws fresh OS entropy)
         # TOUR LOOP
         while self.remainingFlowToAssign > 0.0:  # While all flow is not delivered
             # PRE-TRIP SETUP
@@ -66,219 +84,215 @@ class Ant:
             if self.time > 100000:  # Restart if timed out
                 print("Restarting ant!")
                 self.resetTourAndSolutionAttributes()
+            # Abandon the tour if it can no longer beat the incumbent
+            if self.costToBeat is not None and self.remainingFlowToAssign > 0.0:
+                self.tourCostBound = self.computeTourCostBound()
+                if self.tourCostBound >= self.costToBeat:
+                    self.isTourAborted = True
+                    # print("Aborting ant at cost bound = " + str(self.tourCostBound))  # PRINT OPTION
+                    return
         self.resolveOpposingFlows()  # Eliminates positive flows in opposing directions on every bidirectional edge
-        self.computeResultingNetwork()  # Calculates the cost and data structures for writing to a solution object
+        self.computeResultingNetwork()  # Calculates the cost of the assigned flows
         # print("Solution Cost = " + str(self.trueCost) + "\n")  # PRINT OPTION
 
-    def getPossibleNextMoves(self) -> list:
-        """Returns the possible options the ant could take on their next timestep"""
-        options = []
-        # Evaluate options if you're at supersource
-        if self.currentPosition == -1:
-            for srcIndex in range(self.network.numSources):
-                source = self.network.sourcesArray[srcIndex]
-                cap = self.network.sourceCapsArray[srcIndex]
-                arcID = (-1, source, cap)
-                if self.availableCapacityDict[arcID] > 0.0:
-                    options.append((-1, source, cap))
-        # Evaluate options if you're anywhere else
-        else:
-            nodeObj = self.network.nodesDict[self.currentPosition]
-            # Add all arcs that are not at capacity to the options
-            for edge in nodeObj.outgoingEdges:
-                for cap in self.network.possibleArcCapsArray:
-                    arcID = (edge[0], edge[1], cap)
-                    # Previous is was: if self.availableCapacity[arcID] > 0.0 and arcID not in self.arcsVisitedThisTrip:
-                    if self.availableCapacityDict[arcID] > 0.0:
-                        options.append((edge[0], edge[1], cap))
-            # Give the possibility to go back to the supersource if at a source
-            if nodeObj.nodeType == 0:
-                options.append((nodeObj.nodeID, -1, -1))
-            # Give the possibility to go to the supersink if at a sink
-            elif nodeObj.nodeType == 1:
-                for sinkIndex in range(self.network.numSinks):
-                    if nodeObj.nodeID == self.network.sinksArray[sinkIndex]:
-                        options.append((nodeObj.nodeID, -2, self.network.sinkCapsArray[sinkIndex]))
+    def getPossibleNextMoves(self) -> ndarray:
+        """Returns the arc numbers the ant could take on their next timestep"""
+        # The live arcs leaving the current position are the front of its frontier row (NOTE: -1 is the last row)
+        row = self.currentPosition if self.currentPosition >= 0 else self.network.numTotalNodes
+        if self.isPruningDeadEnds is True and self.isReachabilityStale is True:
+            self.updateReachability()
+        if self.candidateArcsArray is not None and self.hasBacktracked is False:
+            # Only the live candidates are options, unless every candidate is saturated (or a dead end)
+            # NOTE: The candidates are dropped after the trip's first backtrack, as they led the ant into a dead end/cycle
+            candidates = self.candidateArcsArray[self.candidateOffsetsArray[row]:self.candidateOffsetsArray[row + 1]]
+            candidates = candidates[self.availableCapacityArray[candidates] > 0.0]
+            if self.isPruningDeadEnds is True:
+                candidates = candidates[self.canReachSinkArray[self.network.arcToHeadArray[candidates]]]
+            if len(candidates) > 0:
+                return candidates
+        rowStart = self.network.adjacencyOffsetsArray[row]
+        # All arcs that are not at capacity (NOTE: Going back to the supersource from a source is always possible)
+        options = self.frontierArcsArray[rowStart:rowStart + self.frontierCountsArray[row]]
+        if self.isPruningDeadEnds is True:
+            # Exclude moves into dead ends, unless every option is one (i.e. fall back to wandering)
+            prunedOptions = options[self.canReachSinkArray[self.network.arcToHeadArray[options]]]
+            if len(prunedOptions) > 0:
+                return prunedOptions
         return options
 
-    def decideArcToTraverse(self, options: list) -> tuple:
-        """Probabilistically selects the arc the ant will travel on the next timestep"""
-        random.seed()
+    def decideArcToTraverse(self, options: ndarray) -> int:
+        """Probabilistically selects the arc the ant will travel on the next timestep via a roulette wheel"""
         # Check if the only option is to move back to the supersource, and if so, return that option
-        if len(options) == 1 and options[0][1] == -1:
+        if len(options) == 1 and self.network.arcToHeadArray[options[0]] == -1:
             return options[0]
-        # Compute numerators and denominators
-        numerators = []
-        denominator = 0.0
-        for arc in options:
-            thisArcsNumerator = (self.pheromoneDict[arc] ** self.alpha) * (self.goodnessDict[arc] ** self.beta)
-            numerators.append(thisArcsNumerator)
-            denominator += thisArcsNumerator
-        # Build cumulative probability distribution
-        cumulativeProbabilities = [numerators[0] / denominator]
-        for i in range(1, len(numerators)):
-            cumulativeProbabilities.append((numerators[i] / denominator) + cumulativeProbabilities[i - 1])
-        # Roll RNG and select edge
-        rng = random.random()
-        # self.printProbabilityDistribution(rng, options, cumulativeProbabilities)  # PRINT OPTION
-        for arc in range(len(options)):
-            if rng < cumulativeProbabilities[arc]:
-                return options[arc]
+        # Build the cumulative distribution from the colony's precomputed arc weights
+        cumulativeWeights = np.cumsum(self.attractivenessArray[options])
+        # Choose uniformly if every option has zero weight (i.e. all pheromone has underflowed) or the weights overflowed
+        if not np.isfinite(cumulativeWeights[-1]) or cumulativeWeights[-1] <= 0.0:
+            return options[self.rng.integers(len(options))]
+        # Roll RNG and select edge by binary searching the cumulative distribution
+        rng = self.rng.random() * cumulativeWeights[-1]
+        # self.printProbabilityDistribution(rng / cumulativeWeights[-1], options, cumulativeWeights / cumulativeWeights[-1])  # PRINT OPTION
+        return options[np.searchsorted(cumulativeWeights, rng, side="right")]
 
-    def travelArc(self, arcChoice: tuple) -> None:
+    def travelArc(self, arcChoice: int) -> None:
         """Moves the ant across an arc, using the ant's memory to detect and undo cycles and backtracks"""
         self.time += 1  # Increment the timestep
+        arcHead = self.network.arcToHeadArray[arcChoice]
         # If the move is a back track, then undo the flow assigned on the last step
         if self.isVisitedNode(arcChoice) is True:
-            while self.tripStack[-1][1] != arcChoice[1]:
+            while self.network.arcToHeadArray[self.tripStack[-1]] != arcHead:
                 poppedPrevMove = self.tripStack.pop(-1)  # Pop previous move off trip stack
-                self.currentPosition = poppedPrevMove[0]  # Update position by undoing popped move
-                self.nodesVisitedThisTrip.remove(poppedPrevMove[1])  # Remove the popped nodes from the ant's memory
+                self.currentPosition = self.network.arcToTailArray[poppedPrevMove]  # Update position by undoing popped move
+                self.nodesVisitedThisTrip.remove(self.network.arcToHeadArray[poppedPrevMove])  # Remove the popped nodes from the ant's memory
+            self.hasBacktracked = True
         else:
-            self.currentPosition = arcChoice[1]  # Update position (i.e. move across arc)
-            self.nodesVisitedThisTrip.add(arcChoice[1])  # Adds the node to the ant's memory of nodes this trip
+            self.currentPosition = arcHead  # Update position (i.e. move across arc)
+            self.nodesVisitedThisTrip.add(arcHead)  # Adds the node to the ant's memory of nodes this trip
             self.tripStack.append(arcChoice)  # Push the move onto the trip stack
 
-    def isVisitedNode(self, arcChoice: tuple) -> bool:
+    def isVisitedNode(self, arcChoice: int) -> bool:
         """Checks the set of already visited nodes to identify cycles/backtracks"""
-        if arcChoice[1] in self.nodesVisitedThisTrip:
+        if self.network.arcToHeadArray[arcChoice] in self.nodesVisitedThisTrip:
             return True
         else:
             return False
 
     def assignTripFlow(self) -> None:
         """Assigns flow to all arcs traveled, where the amount is the minimum available capacity seen on the trip"""
+        # NOTE: The trip stack never repeats an arc, as the backtracking keeps each trip free of cycles
+        tripArcs = np.array(self.tripStack)
         # Get bottleneck size (i.e. minimum available capacity over all arcs visited on trip)
-        minAvailableCapacityDuringTrip = self.remainingFlowToAssign  # Start the flow to assign at the remaining amount
-        for arc in self.tripStack:
-            if self.availableCapacityDict[arc] < minAvailableCapacityDuringTrip:
-                minAvailableCapacityDuringTrip = self.availableCapacityDict[arc]
-        # Iterate over arcs, assigning flow and deducting from the minimum available capacity
-        for arc in self.tripStack:
-            self.availableCapacityDict[arc] -= minAvailableCapacityDuringTrip
-            self.assignedFlowDict[arc] += minAvailableCapacityDuringTrip
+        minAvailableCapacityDuringTrip = min(self.remainingFlowToAssign, self.availableCapacityArray[tripArcs].min())
+        # Assign flow to every arc traveled and deduct it from their available capacity
+        self.availableCapacityArray[tripArcs] -= minAvailableCapacityDuringTrip
+        self.assignedFlowArray[tripArcs] += minAvailableCapacityDuringTrip
         # Deduct assigned flow from the flow left to assign
         self.remainingFlowToAssign -= minAvailableCapacityDuringTrip
+        # Remove the arcs the bottleneck saturated from the frontier
+        for arc in tripArcs[self.availableCapacityArray[tripArcs] <= 0.0]:
+            self.removeArcFromFrontier(arc)
+
+    def removeArcFromFrontier(self, arc: int) -> None:
+        """Swaps a saturated arc with the last live arc of its frontier row and shrinks the row's live count"""
+        row = self.network.arcToRowArray[arc]
+        slot = self.frontierSlotsArray[arc]
+        lastSlot = self.network.adjacencyOffsetsArray[row] + self.frontierCountsArray[row] - 1
+        lastArc = self.frontierArcsArray[lastSlot]
+        self.frontierArcsArray[slot] = lastArc
+        self.frontierSlotsArray[lastArc] = slot
+        self.frontierArcsArray[lastSlot] = arc
+        self.frontierSlotsArray[arc] = lastSlot
+        self.frontierCountsArray[row] -= 1
+        self.isReachabilityStale = True
+
+    def updateReachability(self) -> None:
+        """Recomputes which nodes can still reach a sink with capacity via a reverse BFS over the non-saturated arcs,
+        including the detours back through the supersource that a trip can take"""
+        numTotalNodes = self.network.numTotalNodes
+        isLiveArc = self.availableCapacityArray[:self.network.numArcs] > 0.0
+        liveTails = self.network.arcToTailArray[:self.network.numArcs][isLiveArc]
+        liveHeads = self.network.arcToHeadArray[:self.network.numArcs][isLiveArc]
+        canReachSink = np.zeros(numTotalNodes, dtype=bool)
+        # Start from the sinks that can still send flow to the supersink
+        frontier = np.zeros(numTotalNodes, dtype=bool)
+        frontier[self.network.sinksArray[self.availableCapacityArray[self.network.sinkArcsOffset:] > 0.0]] = True
+        isSuppliedSource = self.availableCapacityArray[self.network.sourceArcsOffset:self.network.returnArcsOffset] > 0.0
+        isSupersourceReached = False
+        # Expand one BFS level at a time across the live arcs entering the frontier
+        while frontier.any():
+            canReachSink |= frontier
+            reachedTails = liveTails[frontier[liveHeads]]
+            frontier = np.zeros(numTotalNodes, dtype=bool)
+            frontier[reachedTails] = True
+            # Once a source the supersource can still supply reaches a sink, every source does by returning to the supersource
+            if isSupersourceReached is False and (canReachSink[self.network.sourcesArray] & isSuppliedSource).any():
+                isSupersourceReached = True
+                frontier[self.network.sourcesArray] = True
+            frontier &= ~canReachSink
+        self.canReachSinkArray[:numTotalNodes] = canReachSink
+        self.isReachabilityStale = False
 
     def resolveOpposingFlows(self) -> None:
-        """Iterates over resulting network and reduces opposing flows to be unidirectional"""
-        # For each edge
-        for edgeIndex in range(self.network.numEdges):
-            forwardFlow = 0
-            backwardFlow = 0
-            edge = self.network.edgesArray[edgeIndex]
-            # Find the total forward and backward flow
-            for capIndex in range(self.network.numArcCaps):
-                cap = self.network.possibleArcCapsArray[capIndex]
-                forwardFlow += self.assignedFlowDict[(edge[0], edge[1], cap)]
-                backwardFlow += self.assignedFlowDict[(edge[1], edge[0], cap)]
-            # Resolve if both non-zero and equal to one another
-            if 0 < forwardFlow == backwardFlow > 0:
-                for capIndex in range(self.network.numArcCaps):
-                    cap = self.network.possibleArcCapsArray[capIndex]
-                    self.assignedFlowDict[(edge[0], edge[1], cap)] = 0
-                    self.assignedFlowDict[(edge[1], edge[0], cap)] = 0
-            # Resolve if both non-zero and forward flow is greater than backward flow
-            # TODO - This (and the complementary condition below) will probably error out on flow distributed across parallel arcs
-            elif forwardFlow > 0 and 0 < backwardFlow < forwardFlow:
-                netFlow = forwardFlow - backwardFlow
-                for capIndex in range(self.network.numArcCaps):
-                    cap = self.network.possibleArcCapsArray[capIndex]
-                    self.assignedFlowDict[(edge[0], edge[1], cap)] = netFlow
-                    self.assignedFlowDict[(edge[1], edge[0], cap)] = 0
-            # Resolve if both non-zero and forward flow is less than backward flow
-            elif 0 < forwardFlow < backwardFlow and backwardFlow > 0:
-                netFlow = backwardFlow - forwardFlow
-                for capIndex in range(self.network.numArcCaps):
-                    cap = self.network.possibleArcCapsArray[capIndex]
-                    self.assignedFlowDict[(edge[0], edge[1], cap)] = 0
-                    self.assignedFlowDict[(edge[1], edge[0], cap)] = netFlow
+        """Reduces the opposing flows of the ant's solution to be unidirectional"""
+        self.netOpposingFlows(self.assignedFlowArray)
+
+    def netOpposingFlows(self, flowArray: ndarray) -> None:
+        """Nets out opposing flows on every bidirectional edge and every supersource <-> source pair to be unidirectional"""
+        # View the edge arcs as an (edge x capacity) matrix (NOTE: Writing to the view writes to the flow array)
+        edgeFlows = flowArray[:self.network.numArcs].reshape(self.network.numEdges, self.network.numArcCaps)
+        edgeTotals = edgeFlows.sum(axis=1)
+        # Each edge cancels the smaller of its total flow and the total flow of its opposing edge
+        cancelledFlows = np.minimum(edgeTotals, edgeTotals[self.network.edgeToReverseEdgeArray])
+        opposedEdges = np.flatnonzero(cancelledFlows > 0.0)
+        if len(opposedEdges) > 0:
+            # Cancel flow from the parallel arcs carrying the least flow first, so that as few arcs as possible stay open
+            opposedFlows = edgeFlows[opposedEdges]
+            arcOrder = np.argsort(opposedFlows, axis=1, kind="stable")
+            sortedFlows = np.take_along_axis(opposedFlows, arcOrder, axis=1)
+            flowBeforeArcs = np.cumsum(sortedFlows, axis=1) - sortedFlows
+            sortedCancels = np.clip(cancelledFlows[opposedEdges, None] - flowBeforeArcs, 0.0, sortedFlows)
+            np.put_along_axis(opposedFlows, arcOrder, sortedFlows - sortedCancels, axis=1)
+            edgeFlows[opposedEdges] = opposedFlows
+        # Cancel the flow routed back to the supersource against the flow that entered through the same source
+        sourceFlows = flowArray[self.network.sourceArcsOffset:self.network.returnArcsOffset]
+        returnFlows = flowArray[self.network.returnArcsOffset:self.network.sinkArcsOffset]
+        cancelledSourceFlows = np.minimum(sourceFlows, returnFlows)
+        sourceFlows -= cancelledSourceFlows
+        returnFlows -= cancelledSourceFlows
 
     def computeResultingNetwork(self) -> None:
         """Calculates the cost of the ant's solution"""
-        trueCost = 0.0
-        # Calculate source costs
-        for sourceIndex in range(self.network.numSources):
-            sourceID = self.network.sourcesArray[sourceIndex]
-            sourceCapacity = self.network.sourceCapsArray[sourceIndex]
-            sourceFlow = self.assignedFlowDict[(-1, sourceID, sourceCapacity)]
-            self.sourceFlows.append(int(sourceFlow))
-            sourceVariableCost = self.network.sourceVariableCostsArray[sourceIndex]
-            trueCost += sourceVariableCost * sourceFlow
-        # Calculate sink costs
-        for sinkIndex in range(self.network.numSinks):
-            sinkID = self.network.sinksArray[sinkIndex]
-            sinkCapacity = self.network.sinkCapsArray[sinkIndex]
-            sinkFlow = self.assignedFlowDict[(sinkID, -2, sinkCapacity)]
-            self.sinkFlows.append(int(sinkFlow))
-            sinkVariableCost = self.network.sinkVariableCostsArray[sinkIndex]
-            trueCost += sinkVariableCost * sinkFlow
-        # Calculate edge costs
-        for edgeIndex in range(self.network.numEdges):
-            for capIndex in range(self.network.numArcCaps):
-                edge = self.network.edgesArray[edgeIndex]
-                cap = self.network.possibleArcCapsArray[capIndex]
-                arcObj = self.network.arcsDict[(edge[0], edge[1], cap)]
-                arcFlow = self.assignedFlowDict[(edge[0], edge[1], cap)]
-                self.arcFlows[(edgeIndex, capIndex)] = int(arcFlow)
-                self.arcsOpened[(edgeIndex, capIndex)] = 0
-                if arcFlow > 0:
-                    trueCost += arcObj.fixedCost + arcObj.variableCost * arcFlow
-                    self.arcsOpened[(edgeIndex, capIndex)] = 1
-        self.trueCost = trueCost
+        self.trueCost = self.computeFlowCost(self.assignedFlowArray)
+
+    def computeFlowCost(self, flowArray: ndarray) -> float:
+        """Returns the cost of the flows as a dot product with the network's arc cost vectors"""
+        variableCost = np.dot(self.network.arcToVariableCostArray, flowArray)
+        fixedCost = np.dot(self.network.arcToFixedCostArray, flowArray > 0.0)
+        return float(variableCost + fixedCost)
+
+    def computeTourCostBound(self) -> float:
+        """Lower bounds the tour's cost by the costs its flow so far can never shed plus the cheapest cost of the rest"""
+        # NOTE: A later trip crosses an edge pair at most once, so the remaining flow can cancel at most that much of its net flow
+        edgeTotals = self.assignedFlowArray[:self.network.numArcs].reshape(self.network.numEdges, self.network.numArcCaps).sum(axis=1)
+        uncancellableFlows = edgeTotals - edgeTotals[self.network.edgeToReverseEdgeArray] - self.remainingFlowToAssign
+        openEdges = np.flatnonzero(uncancellableFlows > 0.0)
+        edgeCost = (self.edgeMinFixedCostsArray[openEdges].sum() +
+                    np.dot(self.edgeMinVariableCostsArray[openEdges], uncancellableFlows[openEdges]))
+        # The flow out to the supersink only grows, and the net flow out of the sources totals the target flow
+        sinkCost = np.dot(self.sinkVariableCostsArray, self.assignedFlowArray[self.network.sinkArcsOffset:])
+        return float(edgeCost + sinkCost + self.minTargetFlow * self.minSourceVariableCost +
+                     self.remainingFlowToAssign * self.minSinkVariableCost)
 
     def writeSolution(self) -> Solution:
         """Writes the single ant's solution to a Solution instance for visualization/saving"""
-        solution = Solution(self.network, self.minTargetFlow, self.trueCost, self.trueCost, self.sourceFlows,
-                            self.sinkFlows, self.arcFlows, self.arcsOpened, "Ant", False,
-                            self.network.isSourceSinkCapacitated, self.network.isSourceSinkCharged)
-        return solution
+        return self.writeTourRecord().writeSolution(self.network, self.minTargetFlow)
+
+    def writeTourRecord(self) -> TourRecord:
+        """Writes the single ant's tour to a compact Tour Record of its cost and sparse arc flows"""
+        # An abandoned tour is recorded as discarded, with its cost bound in place of its cost
+        if self.isTourAborted is True:
+            return TourRecord(self.tourCostBound, np.empty(0, dtype=np.int64), np.empty(0), isDiscarded=True,
+                              numSteps=self.time)
+        arcIndices = np.flatnonzero(self.assignedFlowArray)
+        # Drop the source -> supersource arcs, which only carry flow that was routed back to the supersource
+        arcIndices = arcIndices[(arcIndices < self.network.returnArcsOffset) | (arcIndices >= self.network.sinkArcsOffset)]
+        return TourRecord(self.trueCost, arcIndices, self.assignedFlowArray[arcIndices], numSteps=self.time)
 
-    def initializeAssignedFlowDict(self) -> dict:
-        """Adds all possible arcs and supersource/sink as keys to the assigned flow dictionary with a value of zero"""
-        assignedFlowDict = {}
-        # For all edge, cap pairs, initialize with zero
-        for edge in self.network.edgesArray:
-            for cap in self.network.possibleArcCapsArray:
-                assignedFlowDict[(edge[0], edge[1], cap)] = 0
-        # For all supersource -> source and visa versa, initialize with zero
-        for srcIndex in range(self.network.numSources):
-            source = self.network.sourcesArray[srcIndex]
-            cap = self.network.sourceCapsArray[srcIndex]
-            assignedFlowDict[(-1, source, cap)] = 0
-            assignedFlowDict[(source, -1, -1)] = 0
-        # For all supersink -> sink, initialize with zero (NOTE: You can't go back from a supersink)
-        for sinkIndex in range(self.network.numSinks):
-            sink = self.network.sinksArray[sinkIndex]
-            cap = self.network.sinkCapsArray[sinkIndex]
-            assignedFlowDict[(sink, -2, cap)] = 0
-        return assignedFlowDict
+    def initializeAssignedFlowArray(self) -> ndarray:
+        """Allocates the assigned flow of every arc number, including the supersource/sink arcs, as zero"""
+        return self.network.flowTemplateArray.copy()
 
-    def initializeAvailableCapacityDict(self) -> dict:
-        """Adds all possible arcs and supersource/sink as keys to the available capacity dictionary with value capacity"""
-        availableCapacity = {}
-        # For all edge, cap pairs, initialize with cap
-        for edge in self.network.edgesArray:
-            for cap in self.network.possibleArcCapsArray:
-                availableCapacity[(edge[0], edge[1], cap)] = cap
-        # For all supersource -> source initialize with cap, and for visa versa initialize with MAX_INT
-        for srcIndex in range(self.network.numSources):
-            source = self.network.sourcesArray[srcIndex]
-            cap = self.network.sourceCapsArray[srcIndex]
-            availableCapacity[(-1, source, cap)] = cap
-            availableCapacity[(source, -1, -1)] = sys.maxsize
-        # For all supersink -> sink, initialize with zero (NOTE: You can't go back from a supersink)
-        for sinkIndex in range(self.network.numSinks):
-            sink = self.network.sinksArray[sinkIndex]
-            cap = self.network.sinkCapsArray[sinkIndex]
-            availableCapacity[(sink, -2, cap)] = cap
-        return availableCapacity
+    def initializeAvailableCapacityArray(self) -> ndarray:
+        """Allocates the available capacity of every arc number as its capacity (NOTE: Source -> supersource is MAX_INT)"""
+        return self.network.capacityTemplateArray.copy()
 
     def resetTripAttributes(self) -> None:
         """Resets the trip attributes after going back to the source"""
         self.currentPosition = -1
         self.tripStack = []
         self.nodesVisitedThisTrip = set()
+        self.hasBacktracked = False
 
     def resetTourAndSolutionAttributes(self) -> None:
         """Resets the solution/tour attributes after finding a complete solution"""
@@ -288,34 +302,36 @@ class Ant:
         self.time = 0
         self.numTrips = 0
         self.remainingFlowToAssign = self.minTargetFlow
-        self.assignedFlowDict = self.initializeAssignedFlowDict()
-        self.availableCapacityDict = self.initializeAvailableCapacityDict()
+        np.copyto(self.assignedFlowArray, self.network.flowTemplateArray)  # Reset in place from the network's templates
+        np.copyto(self.availableCapacityArray, self.network.capacityTemplateArray)
+        np.copyto(self.frontierArcsArray, self.network.adjacencyArcsArray)  # Restores every arc to the frontier
+        np.copyto(self.frontierCountsArray, self.network.adjacencyDegreesArray)
+        np.copyto(self.frontierSlotsArray, self.network.arcToSlotArray)
+        self.isReachabilityStale = True
+        self.tourCostBound = 0.0
+        self.isTourAborted = False
         # Reset solution attributes
         self.trueCost = 0.0
-        self.sourceFlows = []
-        self.sinkFlows = []
-        self.arcFlows = {}
-        self.arcsOpened = {}
 
     def printTripData(self) -> None:
         """Prints the data at each time step"""
         print("==================== TRIP ====================")
         print("Trip Number = " + str(self.numTrips))
         print("Trip Stack:")
-        print(str(self.tripStack))
+        print(str([self.network.arcKeysList[arc] for arc in self.tripStack]))
 
-    def printTimeStepData(self, arcChoice: tuple) -> None:
+    def printTimeStepData(self, arcChoice: int) -> None:
         """Prints the data at each time step"""
         print("----------- TIME STEP -----------")
         print("Time = " + str(self.time))
-        print("Prev. Node = " + str(arcChoice[0]))
-        print("Current Node = " + str(arcChoice[1]))
+        print("Prev. Node = " + str(self.network.arcToTailArray[arcChoice]))
+        print("Current Node = " + str(self.network.arcToHeadArray[arcChoice]))
         print("Is Visited Node? " + str(self.isVisitedNode(arcChoice)))
         print("Trip Stack:")
-        print(str(self.tripStack))
+        print(str([self.network.arcKeysList[arc] for arc in self.tripStack]))
 
     @staticmethod
-    def printProbabilityDistribution(rng: float, options: list, cumulativeProbabilities: list) -> None:
+    def printProbabilityDistribution(rng: float, options: ndarray, cumulativeProbabilities: ndarray) -> None:
         """Prints the cumulative probability distribution generated when an ant considers which edge to chose"""
         percents = []
         for prob in cumulativeProbabilities:
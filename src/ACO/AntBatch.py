@@ -0,0 +1,171 @@
+import numpy as np
+from numpy import ndarray
+
+from src.ACO.Ant import Ant
+from src.ACO.TourRecord import TourRecord
+from src.Network.FlowNetwork import FlowNetwork
+
+
+class AntBatch:
+    """Class that simulates all the ants of an episode in lock-step, holding every ant's tour state in 2D arrays"""
+
+    # =========================================
+    # ============== CONSTRUCTOR ==============
+    # =========================================
+    def __init__(self, network: FlowNetwork, minTargetFlow: float, numAnts: int):
+        """Constructor of an Ant Batch instance"""
+        # Input Attributes
+        self.network = network  # Input network data
+        self.minTargetFlow = minTargetFlow  # Target flow each ant has to assign
+        self.numAnts = numAnts  # Number of ants advanced together at each time step
+
+        # Padded Adjacency (NOTE: Rows are padded with a dummy arc number that never has available capacity)
+        self.padArc = self.network.numAdjacencyArcs
+        self.paddedAdjacencyArray = self.initializePaddedAdjacency()  # Matrix of (node row x maxDegree) arc numbers
+        self.capacityTemplate = np.append(self.network.capacityTemplateArray, 0.0)  # Includes the pad arc
+        self.arcToHeadArray = np.append(self.network.arcToHeadArray, -2)  # Includes the pad arc
+
+        # Batch Tour Attributes (NOTE: Row a of every matrix holds ant a's tour state)
+        self.time = np.zeros(self.numAnts, dtype=np.int64)
+        self.numTrips = np.zeros(self.numAnts, dtype=np.int64)
+        self.currentPositions = np.full(self.numAnts, -1, dtype=np.int64)
+        self.remainingFlowToAssign = np.full(self.numAnts, float(self.minTargetFlow))
+        self.assignedFlowMatrix = np.zeros((self.numAnts, self.padArc + 1))  # Matrix of (ants x arcs) flow assigned
+        self.availableCapacityMatrix = np.tile(self.capacityTemplate, (self.numAnts, 1))  # Matrix of (ants x arcs) capacity
+        self.isActive = np.ones(self.numAnts, dtype=bool)  # Ants that have not finished their tour
+
+        # Batch Trip Attributes
+        self.tripStackMatrix = np.zeros((self.numAnts, 2 * self.network.numTotalNodes + 2), dtype=np.int64)
+        self.tripDepths = np.zeros(self.numAnts, dtype=np.int64)  # Number of arcs on each ant's trip stack
+        self.visitedDepthMatrix = np.full((self.numAnts, self.network.numTotalNodes + 1), -1, dtype=np.int64)  # Stack depth of each visited node, where the last column is the supersource (NOTE: -1 = not visited)
+
+        # Post-Tour Accounting
+        self.accountingAnt = Ant(self.network, self.minTargetFlow, isPruningDeadEnds=False)  # Resolves and costs each ant's flows like the reference engine
+        self.rng = None
+
+    def solveTours(self, attractivenessArray: ndarray, antSeeds: list) -> list:
+        """Advances every ant one arc per time step until all have completed a tour, and returns their tour records"""
+        self.resetBatch()
+        # NOTE: The batch draws all ants' choices from one stream derived from every ant's seed this episode
+        self.rng = np.random.default_rng([int(seed.generate_state(1)[0]) for seed in antSeeds])
+        paddedAttractiveness = np.append(attractivenessArray, 0.0)
+        # LOCK-STEP LOOP
+        while self.isActive.any():
+            ants = np.flatnonzero(self.isActive)
+            arcChoices = self.decideArcsToTraverse(ants, paddedAttractiveness)
+            self.travelArcs(ants, arcChoices)
+            # POST-TRIP ACCOUNTING
+            tripEnders = ants[self.currentPositions[ants] == -2]
+            if len(tripEnders) > 0:
+                self.assignTripFlows(tripEnders)
+        return [self.writeTourRecord(antIndex) for antIndex in range(self.numAnts)]
+
+    def decideArcsToTraverse(self, ants: ndarray, paddedAttractiveness: ndarray) -> ndarray:
+        """Probabilistically selects the next arc of every active ant via a vectorized roulette wheel"""
+        rows = np.where(self.currentPositions[ants] >= 0, self.currentPositions[ants], self.network.numTotalNodes)
+        candidateArcs = self.paddedAdjacencyArray[rows]
+        isOption = self.availableCapacityMatrix[ants[:, None], candidateArcs] > 0.0
+        if not isOption.any(axis=1).all():
+            raise ValueError("Ant has no arc with available capacity to traverse")
+        weights = paddedAttractiveness[candidateArcs] * isOption
+        # Choose uniformly among the options of ants with no positive weight (i.e. only moving back to the supersource) or
+        # whose weights overflowed
+        totalWeights = weights.sum(axis=1)
+        isUnweighted = ~np.isfinite(totalWeights) | (totalWeights <= 0.0)
+        weights[isUnweighted] = isOption[isUnweighted]
+        cumulativeWeights = np.cumsum(weights, axis=1)
+        rng = self.rng.random(len(ants)) * cumulativeWeights[:, -1]
+        choices = (cumulativeWeights > rng[:, None]).argmax(axis=1)
+        return candidateArcs[np.arange(len(ants)), choices]
+
+    def travelArcs(self, ants: ndarray, arcChoices: ndarray) -> None:
+        """Moves every active ant across its arc, undoing the trip back to the node for ants that backtrack (NOTE: As in
+        the reference Ant, returning to the supersource a second time in a trip is a backtrack)"""
+        self.time[ants] += 1
+        arcHeads = self.arcToHeadArray[arcChoices]
+        # The supersource (-1) is remembered in the last column, while the supersink (-2) ends the trip
+        headColumns = np.where(arcHeads == -1, self.network.numTotalNodes, arcHeads)
+        headDepths = np.where(arcHeads != -2, self.visitedDepthMatrix[ants, np.maximum(headColumns, 0)], -1)
+        isBacktrack = headDepths >= 0
+        # Backtracking ants pop the trip stack back to the arc that entered the node and forget the popped nodes
+        backtrackers = ants[isBacktrack]
+        if len(backtrackers) > 0:
+            keptDepths = headDepths[isBacktrack]
+            visitedDepths = self.visitedDepthMatrix[backtrackers]
+            visitedDepths[visitedDepths > keptDepths[:, None]] = -1
+            self.visitedDepthMatrix[backtrackers] = visitedDepths
+            self.tripDepths[backtrackers] = keptDepths + 1
+            self.currentPositions[backtrackers] = arcHeads[isBacktrack]
+        # All other ants push the arc onto their trip stack and remember the node
+        movers = ants[~isBacktrack]
+        moverArcs = arcChoices[~isBacktrack]
+        moverHeads = arcHeads[~isBacktrack]
+        moverColumns = headColumns[~isBacktrack]
+        self.tripStackMatrix[movers, self.tripDepths[movers]] = moverArcs
+        isNode = moverHeads != -2
+        self.visitedDepthMatrix[movers[isNode], moverColumns[isNode]] = self.tripDepths[movers[isNode]]
+        self.tripDepths[movers] += 1
+        self.currentPositions[movers] = moverHeads
+
+    def assignTripFlows(self, tripEnders: ndarray) -> None:
+        """Assigns the bottleneck flow to the arcs of every completed trip and starts each ant's next trip"""
+        maxDepth = self.tripDepths[tripEnders].max()
+        tripArcs = self.tripStackMatrix[tripEnders, :maxDepth]
+        isOnTrip = np.arange(maxDepth)[None, :] < self.tripDepths[tripEnders][:, None]
+        # Get bottleneck size (i.e. minimum available capacity over all arcs visited on trip)
+        tripCapacities = np.where(isOnTrip, self.availableCapacityMatrix[tripEnders[:, None], tripArcs], np.inf)
+        bottlenecks = np.minimum(tripCapacities.min(axis=1), self.remainingFlowToAssign[tripEnders])
+        # Assign flow to every arc traveled (NOTE: A trip never repeats an arc, so the updates do not collide)
+        antRows = np.broadcast_to(tripEnders[:, None], tripArcs.shape)[isOnTrip]
+        flows = np.broadcast_to(bottlenecks[:, None], tripArcs.shape)[isOnTrip]
+        self.availableCapacityMatrix[antRows, tripArcs[isOnTrip]] -= flows
+        self.assignedFlowMatrix[antRows, tripArcs[isOnTrip]] += flows
+        self.remainingFlowToAssign[tripEnders] -= bottlenecks
+        self.numTrips[tripEnders] += 1
+        # PRE-TRIP SETUP
+        self.currentPositions[tripEnders] = -1
+        self.tripDepths[tripEnders] = 0
+        self.visitedDepthMatrix[tripEnders] = -1
+        # Restart timed out ants and retire ants that have assigned all their flow
+        for antIndex in tripEnders[self.time[tripEnders] > 100000]:
+            print("Restarting ant!")
+            self.resetAnt(antIndex)
+        self.isActive[tripEnders] = self.remainingFlowToAssign[tripEnders] > 0.0
+
+    def writeTourRecord(self, antIndex: int) -> TourRecord:
+        """Resolves opposing flows and costs one ant's tour with the reference Ant, returning its tour record"""
+        self.accountingAnt.resetTourAndSolutionAttributes()
+        np.copyto(self.accountingAnt.assignedFlowArray, self.assignedFlowMatrix[antIndex, :self.padArc])
+        self.accountingAnt.resolveOpposingFlows()
+        self.accountingAnt.computeResultingNetwork()
+        tourRecord = self.accountingAnt.writeTourRecord()
+        tourRecord.numSteps = int(self.time[antIndex])  # The accounting ant took no steps of its own
+        return tourRecord
+
+    def initializePaddedAdjacency(self) -> ndarray:
+        """Builds a dense (node row x maxDegree) matrix of the adjacency, padding short rows with the dummy arc"""
+        rowDegrees = np.diff(self.network.adjacencyOffsetsArray)
+        paddedAdjacency = np.full((len(rowDegrees), rowDegrees.max()), self.padArc, dtype=np.int64)
+        columns = np.arange(self.network.numAdjacencyArcs) - np.repeat(self.network.adjacencyOffsetsArray[:-1], rowDegrees)
+        paddedAdjacency[np.repeat(np.arange(len(rowDegrees)), rowDegrees), columns] = self.network.adjacencyArcsArray
+        return paddedAdjacency
+
+    def resetAnt(self, antIndex: int) -> None:
+        """Resets the tour attributes of a single ant"""
+        self.time[antIndex] = 0
+        self.numTrips[antIndex] = 0
+        self.remainingFlowToAssign[antIndex] = self.minTargetFlow
+        self.assignedFlowMatrix[antIndex] = 0.0
+        self.availableCapacityMatrix[antIndex] = self.capacityTemplate
+
+    def resetBatch(self) -> None:
+        """Resets the tour and trip attributes of every ant in the batch"""
+        self.time[:] = 0
+        self.numTrips[:] = 0
+        self.currentPositions[:] = -1
+        self.remainingFlowToAssign[:] = self.minTargetFlow
+        self.assignedFlowMatrix[:] = 0.0
+        self.availableCapacityMatrix[:] = self.capacityTemplate
+        self.isActive[:] = True
+        self.tripDepths[:] = 0
+        self.visitedDepthMatrix[:] = -1
@@ -0,0 +1,51 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from numpy import ndarray
+
+from src.ACO.Ant import Ant
+from src.Network.FlowNetwork import FlowNetwork
+
+workerAnt = None  # Ant owned by a worker process, which is built once from the network sent when the worker starts
+
+
+def initializeWorker(network: FlowNetwork, minTargetFlow: float, antClass: type, antOptions: dict) -> None:
+    """Builds the worker process's ant (NOTE: Runs once per worker, so the network is only sent once)"""
+    global workerAnt
+    workerAnt = antClass(network, minTargetFlow, **antOptions)
+
+
+def solveToursInWorker(attractivenessArray: ndarray, antSeeds: list, costToBeat: float, candidateLists: tuple) -> list:
+    """Has the worker's ant complete one tour per seed and returns only the compact tour records"""
+    tourRecords = []
+    for seed in antSeeds:
+        workerAnt.findSolution(attractivenessArray, seed, costToBeat=costToBeat, candidateLists=candidateLists)
+        tourRecords.append(workerAnt.writeTourRecord())
+        workerAnt.resetTourAndSolutionAttributes()
+    return tourRecords
+
+
+class AntPool:
+    """Class that spreads the independent tours of an episode over a pool of worker processes"""
+
+    def __init__(self, network: FlowNetwork, minTargetFlow: float, numWorkers: int, antClass=Ant, antOptions=None):
+        """Constructor of an Ant Pool instance, which starts the worker processes"""
+        self.numWorkers = numWorkers
+        if antOptions is None:
+            antOptions = {}  # Keyword arguments passed to the constructor of each worker's ant
+        self.executor = ProcessPoolExecutor(max_workers=numWorkers, initializer=initializeWorker,
+                                            initargs=(network, minTargetFlow, antClass, antOptions))
+
+    def solveTours(self, attractivenessArray: ndarray, antSeeds: list, costToBeat=None, candidateLists=None) -> list:
+        """Solves one tour per seed across the workers and returns the tour records in the order of the seeds"""
+        # Send each worker one contiguous chunk of seeds along with this episode's arc weights and candidate lists
+        seedChunks = [list(chunk) for chunk in np.array_split(np.array(antSeeds, dtype=object), self.numWorkers)]
+        tourRecords = []
+        for chunkRecords in self.executor.map(solveToursInWorker, [attractivenessArray] * len(seedChunks), seedChunks,
+                                              [costToBeat] * len(seedChunks), [candidateLists] * len(seedChunks)):
+            tourRecords.extend(chunkRecords)
+        return tourRecords
+
+    def shutdown(self) -> None:
+        """Stops the worker processes"""
+        self.executor.shutdown()
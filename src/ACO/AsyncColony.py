@@ -0,0 +1,161 @@
+import queue
+import time
+from multiprocessing import Event, Process, Queue, Value
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from src.ACO.Colony import Colony
+from src.ACO.ColonyImprovement import ColonyImprovement
+from src.Network.FlowNetwork import FlowNetwork
+
+
+def buildToursInWorker(sharedMemoryName: str, network: FlowNetwork, minTargetFlow: float, antClass: type,
+                       antOptions: dict, seed: np.random.SeedSequence, recordQueue: Queue, stopEvent: Event,
+                       bestKnownCost: Value, isAbortingDominatedTours: bool, numCandidateEdges: int) -> None:
+    """Has the worker's ant build tours one after another against the shared arc weights until told to stop"""
+    recordQueue.cancel_join_thread()  # Tours still queued when the colony stops are dropped rather than blocking the exit
+    sharedMemory = SharedMemory(name=sharedMemoryName)
+    attractivenessArray = np.ndarray((network.numAdjacencyArcs,), dtype=float, buffer=sharedMemory.buf)
+    ant = antClass(network, minTargetFlow, **antOptions)
+    try:
+        while not stopEvent.is_set():
+            # NOTE: The daemon may update the arc weights while the tour is built, which the ant sees straight away
+            costToBeat = bestKnownCost.value if isAbortingDominatedTours is True else np.inf
+            # The candidate lists are rebuilt from the shared arc weights as they stand at the start of each tour
+            candidateLists = None
+            if numCandidateEdges is not None:
+                candidateLists = Colony.buildCandidateLists(network, attractivenessArray, numCandidateEdges)
+            ant.findSolution(attractivenessArray, seed.spawn(1)[0], costToBeat=costToBeat if costToBeat < np.inf else None,
+                             candidateLists=candidateLists)
+            recordQueue.put(ant.writeTourRecord())
+            ant.resetTourAndSolutionAttributes()
+    finally:
+        del ant, attractivenessArray
+        sharedMemory.close()
+
+
+class AsyncColony(Colony):
+    """Class that defines an Asynchronous Colony, whose ants build tours continuously in worker processes against a
+    shared pheromone store that a daemon updates on a schedule, rather than at the end of every episode"""
+
+    # =========================================
+    # ============== CONSTRUCTOR ==============
+    # =========================================
+    def __init__(self, network: FlowNetwork, minTargetFlow: float, numAnts: int, numEpisodes: int, seed=None,
+                 numWorkers=2, engine="python", isPruningDeadEnds=False, isAbortingDominatedTours=False,
+                 numCandidateEdges=None, updateIntervalTours=None, updateIntervalSeconds=None):
+        """Constructor of an Asynchronous Colony instance"""
+        if engine == "batch":
+            raise ValueError("The batch engine solves whole episodes in lock-step and cannot run asynchronously")
+        super().__init__(network, minTargetFlow, numAnts, numEpisodes, seed=seed, numWorkers=numWorkers,
+                         engine=engine, isPruningDeadEnds=isPruningDeadEnds,
+                         isAbortingDominatedTours=isAbortingDominatedTours, numCandidateEdges=numCandidateEdges)
+        # Daemon Schedule (NOTE: The daemon updates when either interval is reached)
+        # NOTE: An "episode" of an asynchronous colony is the span between two daemon updates
+        if updateIntervalTours is None and updateIntervalSeconds is None:
+            updateIntervalTours = numAnts  # By default, update as often as a synchronous colony would
+        self.updateIntervalTours = updateIntervalTours  # Number of finished tours between daemon updates (NOTE: None = not scheduled by tours)
+        self.updateIntervalSeconds = updateIntervalSeconds  # Seconds between daemon updates (NOTE: None = not scheduled by time)
+        self.numToursSolved = 0  # Number of tours received by the daemon over the last solve
+
+    def initializePopulation(self) -> list:
+        """Leaves the population empty, as each worker process builds its own ant"""
+        return []
+
+    def solveNetworkIncrementally(self, drawing=False):
+        """Generator of the daemon loop, which yields a Colony Improvement after every update that improves the best
+        cost (NOTE: Stops after numAnts * numEpisodes tours, unless a termination policy is met first)"""
+        # Move the arc weights into shared memory, which every worker's ant reads from directly
+        sharedMemory = SharedMemory(create=True, size=self.network.numAdjacencyArcs * np.dtype(float).itemsize)
+        self.attractivenessArray = np.ndarray((self.network.numAdjacencyArcs,), dtype=float, buffer=sharedMemory.buf)
+        self.pheromoneStore.changedArcs = None  # Writes every arc weight into the new shared array
+        self.updateAttractiveness()
+        recordQueue = Queue()
+        stopEvent = Event()
+        bestKnownCost = Value("d", self.bestKnownCost if self.bestKnownCost is not None else np.inf, lock=False)
+        workers = []
+        startTime = time.perf_counter()
+        lastUpdateTime = startTime
+        numStallEpisodes = 0
+        episode = self.numEpisodesSolved
+        toursSinceUpdate = []
+        self.numToursSolved = 0
+        self.stopReason = "episodes"
+        try:
+            # Start the workers, which each build tours from their own random stream until stopped
+            for workerSeed in self.seedSequence.spawn(self.numWorkers):
+                worker = Process(target=buildToursInWorker,
+                                 args=(sharedMemory.name, self.network, self.minTargetFlow, self.getAntClass(),
+                                       {"isPruningDeadEnds": self.isPruningDeadEnds}, workerSeed, recordQueue,
+                                       stopEvent, bestKnownCost, self.isAbortingDominatedTours,
+                                       self.numCandidateEdges), daemon=True)
+                worker.start()
+                workers.append(worker)
+            # DAEMON LOOP
+            while True:
+                if self.isCancelled is True:
+                    self.stopReason = "cancelled"
+                    break
+                # Receive the next finished tour (NOTE: The timeout keeps the time schedule running without tours)
+                try:
+                    toursSinceUpdate.append(recordQueue.get(timeout=0.1))
+                    self.numToursSolved += 1
+                except queue.Empty:
+                    if any(worker.is_alive() for worker in workers) is False:
+                        raise RuntimeError("Every worker process of the asynchronous colony has stopped")
+                # Apply a daemon update if the schedule is due, or for the last tours before the colony stops
+                currentTime = time.perf_counter()
+                isOutOfTours = self.numToursSolved >= self.numAnts * self.numEpisodes
+                isOutOfTime = self.timeLimit is not None and currentTime - startTime >= self.timeLimit
+                isUpdateDue = ((self.updateIntervalTours is not None and len(toursSinceUpdate) >= self.updateIntervalTours)
+                               or (self.updateIntervalSeconds is not None and
+                                   currentTime - lastUpdateTime >= self.updateIntervalSeconds))
+                if len(toursSinceUpdate) > 0 and (isUpdateDue or isOutOfTours or isOutOfTime):
+                    # POST-EXPLORATION DAEMON UPDATES
+                    previousBestCost = self.bestKnownCost
+                    self.updateBestSolution(toursSinceUpdate)  # Updates the best solution only if these tours contain it
+                    isImproved = self.bestKnownCost != previousBestCost
+                    if isImproved is True:
+                        self.improvementData.append((episode, currentTime - startTime, self.bestKnownCost))  # Save the time of the improvement
+                        bestKnownCost.value = self.bestKnownCost  # Share the improved cost with the workers' ants
+                        numStallEpisodes = 0
+                    else:
+                        numStallEpisodes += 1
+                    self.discardedAntsData.append(sum(tourRecord.isDiscarded for tourRecord in toursSinceUpdate))  # Save the number of abandoned tours
+                    self.stepsData.append(sum(tourRecord.numSteps for tourRecord in toursSinceUpdate))  # Save the number of time steps taken
+                    self.convergenceData.append(self.bestKnownCost)  # Save the best known cost at this update
+                    self.evaporatePheromone()  # Reduces the pheromone across every arc based on rho
+                    self.depositPheromone()  # Deposits new pheromone on the arcs in the best known solution
+                    self.updateAttractiveness()  # Updates the shared arc weights whose pheromone changed, which the ants use at once
+                    toursSinceUpdate = []
+                    lastUpdateTime = currentTime
+                    if isImproved is True:
+                        yield ColonyImprovement(self.network, self.minTargetFlow, episode, currentTime - startTime,
+                                                self.bestKnownRecord)
+                    episode += 1
+                    self.numEpisodesSolved = episode
+                    # Stop early if any termination policy is met, or at the end of the tour budget
+                    stopReason = self.getStopReason(numStallEpisodes, time.perf_counter() - startTime)
+                    if stopReason is not None:
+                        self.stopReason = stopReason
+                        break
+                    if isOutOfTours is True:
+                        break
+                elif isOutOfTime is True:
+                    self.stopReason = "time"
+                    break
+        except GeneratorExit:
+            self.stopReason = "cancelled"  # The caller closed the generator rather than consuming every update
+            raise
+        finally:
+            self.isCancelled = False  # A cancel only stops the solve it was made during (or the next one)
+            stopEvent.set()
+            for worker in workers:
+                worker.join(timeout=5)
+                if worker.is_alive():
+                    worker.terminate()
+            # Keep the final arc weights in private memory before releasing the shared memory
+            self.attractivenessArray = np.array(self.attractivenessArray)
+            sharedMemory.close()
+            sharedMemory.unlink()
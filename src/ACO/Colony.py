@@ -1,6 +1,18 @@
+import json
+import os
 import sys
+import time
+
+import numpy as np
+from numpy import ndarray
 
 from src.ACO.Ant import Ant
+from src.ACO.AntBatch import AntBatch
+from src.ACO.AntPool import AntPool
+from src.ACO.ColonyImprovement import ColonyImprovement
+from src.ACO.NumbaAnt import NumbaAnt
+from src.ACO.PheromoneStore import PheromoneStore
+from src.ACO.TourRecord import TourRecord
 from src.Network.FlowNetwork import FlowNetwork
 from src.Network.Solution import Solution
 from src.Network.SolutionVisualizer import SolutionVisualizer
@@ -12,11 +24,19 @@ class Colony:
     # =========================================
     # ============== CONSTRUCTOR ==============
     # =========================================
-    def __init__(self, network: FlowNetwork, minTargetFlow: float, numAnts: int, numEpisodes: int):
+    def __init__(self, network: FlowNetwork, minTargetFlow: float, numAnts: int, numEpisodes: int, seed=None, numWorkers=1,
+                 engine="python", isPruningDeadEnds=False, isAbortingDominatedTours=False, numCandidateEdges=None):
         """Constructor of a Colony instance"""
+        if engine == "batch" and numCandidateEdges is not None:
+            raise ValueError("The batch engine draws from whole padded adjacency rows and cannot use candidate lists")
+        if engine == "batch" and isPruningDeadEnds is True:
+            raise ValueError("The batch engine keeps no per-ant reachability and cannot prune dead ends")
+        if engine == "batch" and isAbortingDominatedTours is True:
+            raise ValueError("The batch engine costs tours only once all of its ants finish and cannot abort dominated tours")
         # Input Attributes
         self.network = network
         self.minTargetFlow = minTargetFlow
+        self.seed = seed  # Seed of the colony's random streams (NOTE: None is irreproducible)
 
         # Hyperparameters
         self.numEpisodes = numEpisodes  # One episode = All the ants completing one tour (i.e. creating a valid solution) each
@@ -26,146 +46,431 @@ class Colony:
         self.alpha = 1  # alpha = Relative importance to the ant of pheromone over "goodness" of arc
         self.beta = 10  # beta = Relative importance to the ant of "goodness" of arc over pheromone
         self.Q = 20  # Q = Proportionality scalar of best solution, which scales how much pheromone the best solution deposits
+        self.numWorkers = numWorkers  # Number of worker processes the ants of an episode are spread over (NOTE: 1 = in series; ignored by the batch engine)
+        self.engine = engine  # Tour construction engine = {"python": reference Ant, "numba": Numba-compiled NumbaAnt, "batch": lock-step AntBatch}
+        self.isPruningDeadEnds = isPruningDeadEnds  # Ants exclude moves into nodes that can no longer reach a sink (NOTE: Not supported by the batch engine)
+        self.isAbortingDominatedTours = isAbortingDominatedTours  # Ants abandon tours whose cost bound cannot beat the best known cost (NOTE: Not supported by the batch engine)
+        self.numCandidateEdges = numCandidateEdges  # Ants only choose among the arcs of the k most attractive edges of each node while any is live (NOTE: None = every arc)
+
+        # Termination Policies (NOTE: None disables a policy, and the colony always stops after numEpisodes)
+        self.maxStallEpisodes = None  # Stop after this many consecutive episodes without improving the best known cost
+        self.minPheromoneEntropy = None  # Stop once the normalized entropy of the pheromone falls below this (i.e. the colony has converged)
+        self.timeLimit = None  # Stop once this many seconds have passed since the solve started (NOTE: Checked between episodes)
+        self.targetCost = None  # Stop once the best known cost is at or below this cost
 
         # Colony Attributes
         self.population = self.initializePopulation()  # Contains the population of ants
-        self.pheromoneDict = self.initializePheromoneDict()  # Dictionary indexed on key (fromNode, toNode, cap) with value (pheromone deposited)
+        self.antBatch = self.initializeAntBatch()  # Simulates the whole population as arrays if the batch engine is selected
+        self.pheromoneStore = self.initializePheromoneStore()  # Vector indexed on arc number with value (pheromone deposited), evaporated lazily
         self.goodnessDict = self.initializeGoodnessOfArcDict()  # Dictionary indexed on key (fromNode, toNode, cap) with value (eta) (i.e. the "goodness" of taking that arc)
+        self.goodnessArray = self.initializeGoodnessOfArcArray()  # Array indexed on arc number with value (eta), which never changes
+        self.weightedGoodnessArray = None  # Array indexed on arc number with value (eta^beta), computed with the first arc weights
+        self.attractivenessArray = None  # Array indexed on arc number with value proportional to (pheromone^alpha * goodness^beta), updated each episode
+        self.candidateLists = None  # (offsets, arcs) of each node's candidate moves, rebuilt from the arc weights each episode if candidate lists are used
         self.bestKnownCost = None  # Stores the lowest cost solution found so far
-        self.bestKnownSolution = None  # Stores the global best solution found so far
+        self.bestKnownRecord = None  # Stores the compact tour record (i.e. sparse arc flows) of the global best solution found so far
+        self.bestKnownSolution = None  # Solution of the best known record, which is only written when asked for by getBestSolution()
         self.convergenceData = []  # Stores the best known cost after each episode of the colony
+        self.discardedAntsData = []  # Stores the number of ants that abandoned their tour in each episode of the colony
+        self.stepsData = []  # Stores the total time steps taken by the ants in each episode of the colony
+        self.improvementData = []  # Stores (episode, seconds since the solve started, best known cost) for every improvement of the colony
+        self.stopReason = None  # Why the colony stopped = {"episodes", "stall", "entropy", "time", "target", "cancelled"}
+        self.isCancelled = False  # Set by cancel() to stop the solve between episodes
         self.visual = None  # Object used to view the best solutions of the episode over time
+        self.seedSequence = np.random.SeedSequence(self.seed)  # Spawns an independent seed for every ant's tour
+        self.numEpisodesSolved = 0  # Number of episodes solved so far, which a resumed solve continues from
 
     def solveNetwork(self, drawing=True) -> Solution:
-        """Main loop that solves the Flow Network instance with the ACO"""
-        # EPISODE LOOP
-        for episode in range(self.numEpisodes):
-            # print("\nStarting Episode " + str(episode) + "...")  # PRINT OPTION
-            # INDIVIDUAL ANT EXPLORATION LOOP
-            for antIndex in range(self.numAnts):
-                # print("Solving ant " + str(antIndex) + "...")  # PRINT OPTION
-                # In series, solve each ant one at a time
-                self.population[antIndex].findSolution(self.pheromoneDict, self.goodnessDict)
-            # POST-EXPLORATION DAEMON UPDATES
-            # print("Doing post-exploration updates...")  # PRINT OPTION
-            self.updateBestSolution()  # Updates the best solution only if this population contains it
-            self.convergenceData.append(self.bestKnownCost)  # Save the best known cost at this episode
-            self.evaporatePheromone()  # Reduces the pheromone across the entire dictionary based on rho
-            self.depositPheromone()  # Deposits new pheromone on the arcs in the best known solution
-            self.resetAllAnts()  # Clears the tour/solution attributes of every ant in the population for the next episode
-            if drawing is True:
-                self.visual = SolutionVisualizer(self.bestKnownSolution)  # Instantiate a visualizer
-                self.visual.drawGraphWithLabels(leadingText="Ep." + str(episode) + "_")  # Draw graph
-        return self.bestKnownSolution  # Should return the best solution found at the end
-
-    def updateBestSolution(self) -> None:
-        """Finds the best solution in the current population and updates the global best if necessary"""
+        """Main loop that solves the Flow Network instance with the ACO (NOTE: Continues from any episodes already solved)"""
+        for improvement in self.solveNetworkIncrementally(drawing=drawing):
+            pass  # Runs every episode without handling the improvements as they happen
+        return self.getBestSolution()  # Should return the best solution found at the end
+
+    def solveNetworkIncrementally(self, drawing=False):
+        """Generator of the main loop that yields a Colony Improvement after every episode that improves the best cost"""
+        # Start the worker processes if the ants are solved in parallel
+        antPool = None
+        if self.numWorkers > 1 and self.antBatch is None:
+            antPool = AntPool(self.network, self.minTargetFlow, self.numWorkers, antClass=self.getAntClass(),
+                              antOptions={"isPruningDeadEnds": self.isPruningDeadEnds})
+        self.updateAttractiveness()  # Computes the arc weights (and any candidate lists) the ants use in the first episode
+        startTime = time.perf_counter()
+        numStallEpisodes = 0  # Number of consecutive episodes without improving the best known cost
+        self.stopReason = "episodes"
+        try:
+            # EPISODE LOOP
+            for episode in range(self.numEpisodesSolved, self.numEpisodes):
+                # Stop if the solve was cancelled by the caller (NOTE: Including before the first episode)
+                if self.isCancelled is True:
+                    self.stopReason = "cancelled"
+                    break
+                # print("\nStarting Episode " + str(episode) + "...")  # PRINT OPTION
+                antSeeds = self.seedSequence.spawn(self.numAnts)  # Each ant gets its own random stream for this episode's tour
+                tourRecords = self.solveEpisodeTours(antSeeds, antPool)  # Has every ant in the population complete a tour
+                # POST-EXPLORATION DAEMON UPDATES
+                # print("Doing post-exploration updates...")  # PRINT OPTION
+                previousBestCost = self.bestKnownCost
+                self.updateBestSolution(tourRecords)  # Updates the best solution only if this population contains it
+                isImproved = self.bestKnownCost != previousBestCost
+                if isImproved is True:
+                    self.improvementData.append((episode, time.perf_counter() - startTime, self.bestKnownCost))  # Save the time of the improvement
+                    numStallEpisodes = 0
+                else:
+                    numStallEpisodes += 1
+                self.discardedAntsData.append(sum(tourRecord.isDiscarded for tourRecord in tourRecords))  # Save the number of abandoned tours
+                # print("Discarded " + str(self.discardedAntsData[-1]) + " of " + str(self.numAnts) + " ants")  # PRINT OPTION
+                self.stepsData.append(sum(tourRecord.numSteps for tourRecord in tourRecords))  # Save the number of time steps taken
+                self.convergenceData.append(self.bestKnownCost)  # Save the best known cost at this episode
+                self.evaporatePheromone()  # Reduces the pheromone across every arc based on rho
+                self.depositPheromone()  # Deposits new pheromone on the arcs in the best known solution
+                self.updateAttractiveness()  # Updates the arc weights whose pheromone changed for the next episode
+                self.numEpisodesSolved = episode + 1
+                self.resetAllAnts()  # Clears the tour/solution attributes of every ant in the population for the next episode
+                if drawing is True:
+                    self.visual = SolutionVisualizer(self.getBestSolution())  # Instantiate a visualizer
+                    self.visual.drawGraphWithLabels(leadingText="Ep." + str(episode) + "_")  # Draw graph
+                # Hand the improvement to the caller, who may cancel before the next episode
+                if isImproved is True:
+                    yield ColonyImprovement(self.network, self.minTargetFlow, episode, self.improvementData[-1][1],
+                                            self.bestKnownRecord)
+                # Stop early if any termination policy is met
+                stopReason = self.getStopReason(numStallEpisodes, time.perf_counter() - startTime)
+                if stopReason is not None:
+                    self.stopReason = stopReason
+                    # print("Stopping after episode " + str(episode) + " due to " + stopReason)  # PRINT OPTION
+                    break
+        except GeneratorExit:
+            self.stopReason = "cancelled"  # The caller closed the generator rather than consuming every episode
+            raise
+        finally:
+            self.isCancelled = False  # A cancel only stops the solve it was made during (or the next one)
+            if antPool is not None:
+                antPool.shutdown()
+
+    def cancel(self) -> None:
+        """Stops the current solve, or the next one if none is running, between episodes"""
+        self.isCancelled = True
+
+    def setTerminationPolicies(self, maxStallEpisodes=None, minPheromoneEntropy=None, timeLimit=None,
+                               targetCost=None) -> None:
+        """Sets the policies that stop the colony before numEpisodes, where any policy that is met stops it"""
+        self.maxStallEpisodes = maxStallEpisodes
+        self.minPheromoneEntropy = minPheromoneEntropy
+        self.timeLimit = timeLimit
+        self.targetCost = targetCost
+
+    def getStopReason(self, numStallEpisodes: int, elapsedTime: float) -> str:
+        """Returns the termination policy met after an episode, or None if the colony should keep going"""
+        if self.targetCost is not None and self.bestKnownCost <= self.targetCost:
+            return "target"
+        if self.maxStallEpisodes is not None and numStallEpisodes >= self.maxStallEpisodes:
+            return "stall"
+        if self.timeLimit is not None and elapsedTime >= self.timeLimit:
+            return "time"
+        if self.minPheromoneEntropy is not None and self.pheromoneStore.getPheromoneEntropy() < self.minPheromoneEntropy:
+            return "entropy"
+        return None
+
+    def solveEpisodeTours(self, antSeeds: list, antPool: AntPool) -> list:
+        """Has each ant complete a tour, either in series or spread over the worker processes, and returns the tour records"""
+        # The ants abandon their tours against the best known cost, if aborting is on and an incumbent exists
+        costToBeat = self.bestKnownCost if self.isAbortingDominatedTours is True else None
+        if antPool is not None:
+            # In parallel, only the arc weights are sent and only each ant's cost and sparse flows come back
+            return antPool.solveTours(self.attractivenessArray, antSeeds, costToBeat=costToBeat,
+                                      candidateLists=self.candidateLists)
+        if self.antBatch is not None:
+            # In lock-step, every ant advances one arc per time step
+            return self.antBatch.solveTours(self.attractivenessArray, antSeeds)
+        tourRecords = []
+        # INDIVIDUAL ANT EXPLORATION LOOP
+        for antIndex in range(self.numAnts):
+            # print("Solving ant " + str(antIndex) + "...")  # PRINT OPTION
+            # In series, solve each ant one at a time
+            self.population[antIndex].findSolution(self.attractivenessArray, antSeeds[antIndex], costToBeat=costToBeat,
+                                                   candidateLists=self.candidateLists)
+            tourRecords.append(self.population[antIndex].writeTourRecord())
+        return tourRecords
+
+    def updateBestSolution(self, tourRecords: list) -> None:
+        """Finds the best tour in the current population and updates the global best if necessary"""
         currentBestCost = sys.maxsize
-        currentBestAnt = None
-        # Iterate over the current population to find current best
-        for ant in self.population:
-            if ant.trueCost < currentBestCost:
-                currentBestCost = ant.trueCost
-                currentBestAnt = ant
+        currentBestRecord = None
+        # Iterate over the current population's completed tours to find current best
+        for tourRecord in tourRecords:
+            if tourRecord.isDiscarded is False and tourRecord.trueCost < currentBestCost:
+                currentBestCost = tourRecord.trueCost
+                currentBestRecord = tourRecord
         # Compare current best to global best
+        # NOTE: Only the compact record is kept, and any Solution written for the previous best is dropped
         if self.bestKnownCost is None:
             self.bestKnownCost = currentBestCost
-            self.bestKnownSolution = currentBestAnt.writeSolution()
+            self.bestKnownRecord = currentBestRecord
+            self.bestKnownSolution = None
         elif currentBestCost < self.bestKnownCost:
             self.bestKnownCost = currentBestCost
-            self.bestKnownSolution = currentBestAnt.writeSolution()
+            self.bestKnownRecord = currentBestRecord
+            self.bestKnownSolution = None
+
+    def receiveMigrant(self, tourRecord: TourRecord) -> None:
+        """Adopts a tour found elsewhere (e.g. by another colony) as the best known solution if it is better"""
+        if tourRecord is not None and (self.bestKnownCost is None or tourRecord.trueCost < self.bestKnownCost):
+            self.bestKnownCost = tourRecord.trueCost
+            self.bestKnownRecord = tourRecord
+            self.bestKnownSolution = None
+
+    def getBestSolution(self) -> Solution:
+        """Returns the best known solution, writing it from the best known record the first time it is asked for"""
+        if self.bestKnownSolution is None and self.bestKnownRecord is not None:
+            self.bestKnownSolution = self.bestKnownRecord.writeSolution(self.network, self.minTargetFlow)
+        return self.bestKnownSolution
 
     def evaporatePheromone(self) -> None:
-        """Evaporates pheromone using (1-rho)*pheromone across the entire dictionary"""
-        for arc in self.pheromoneDict.keys():
-            self.pheromoneDict[arc] = self.pheromoneDict[arc] * (1 - self.evaporationRate)
+        """Evaporates pheromone using (1-rho)*pheromone across every arc, which only rescales the pheromone store"""
+        self.pheromoneStore.evaporatePheromone(self.evaporationRate)
 
     def depositPheromone(self) -> None:
         """Deposits new pheromone on the arcs contained in the best known solution so far"""
-        # Deposit pheromone on edges
-        for edgeIndex in range(self.network.numEdges):
-            for capIndex in range(self.network.numArcCaps):
-                edge = self.network.edgesArray[edgeIndex]
-                cap = self.network.possibleArcCapsArray[capIndex]
-                arcFlow = self.bestKnownSolution.arcFlows[(edgeIndex, capIndex)]
-                if arcFlow > 0.0:
-                    # OLD: self.pheromoneDict[(edge[0], edge[1], cap)] += self.Q / self.bestKnownCost
-                    self.pheromoneDict[(edge[0], edge[1], cap)] += (self.Q * arcFlow) / self.bestKnownCost
-        # Deposit pheromone on sources
-        for sourceIndex in range(self.network.numSources):
-            source = self.network.sourcesArray[sourceIndex]
-            srcFlow = self.bestKnownSolution.sourceFlows[sourceIndex]
-            if srcFlow > 0.0:
-                srcKey = (-1, source, self.network.sourceCapsArray[sourceIndex])
-                # OLD: self.pheromoneDict[srcKey] += self.Q / self.bestKnownCost
-                self.pheromoneDict[srcKey] += (self.Q * srcFlow) / self.bestKnownCost
-        # Deposit pheromone on sinks
-        for sinkIndex in range(self.network.numSinks):
-            sink = self.network.sinksArray[sinkIndex]
-            sinkFlow = self.bestKnownSolution.sinkFlows[sinkIndex]
-            if sinkFlow > 0.0:
-                sinkKey = (sink, -2, self.network.sinkCapsArray[sinkIndex])
-                # OLD: self.pheromoneDict[sinkKey] += self.Q / self.bestKnownCost
-                self.pheromoneDict[sinkKey] += (self.Q * sinkFlow) / self.bestKnownCost
+        # Deposit pheromone on the arcs, sources and sinks with flow, in proportion to their flow
+        # OLD: Deposited self.Q / self.bestKnownCost on every arc with flow
+        amounts = (self.Q * self.bestKnownRecord.arcFlows) / self.bestKnownCost
+        self.pheromoneStore.depositPheromone(self.bestKnownRecord.arcIndices, amounts)
+
+    def updateAttractiveness(self) -> None:
+        """Updates the (pheromone^alpha * goodness^beta) weight of the arc numbers whose pheromone changed"""
+        # NOTE: The global scale of the pheromone is left out, as scaling every weight alike leaves the ants' choices unchanged
+        if self.alpha > 0:
+            self.pheromoneStore.capStoredPheromone(1e100 ** (1.0 / self.alpha))  # Keeps pheromone^alpha far from float overflow
+        changedArcs = self.pheromoneStore.popChangedArcs()
+        if self.attractivenessArray is None or changedArcs is None:
+            self.weightedGoodnessArray = self.goodnessArray ** self.beta
+            attractivenessArray = (self.pheromoneStore.storedPheromoneArray ** self.alpha) * self.weightedGoodnessArray
+            if self.attractivenessArray is None:
+                self.attractivenessArray = attractivenessArray
+            else:
+                self.attractivenessArray[:] = attractivenessArray  # In place, as the array may be shared with running ants
+        else:
+            self.attractivenessArray[changedArcs] = ((self.pheromoneStore.storedPheromoneArray[changedArcs] ** self.alpha) *
+                                                     self.weightedGoodnessArray[changedArcs])
+        if self.numCandidateEdges is not None:
+            self.candidateLists = self.buildCandidateLists(self.network, self.attractivenessArray, self.numCandidateEdges)
+
+    @staticmethod
+    def buildCandidateLists(network: FlowNetwork, attractivenessArray: ndarray, numCandidateEdges: int) -> tuple:
+        """Returns the (offsets, arcs) of each adjacency row's candidate moves, which are the parallel arcs of its k most
+        attractive edges plus any supersource -> source or sink -> supersink arcs (NOTE: Source -> supersource arcs are
+        left to the fallback)"""
+        arcs = network.adjacencyArcsArray
+        rows = network.arcToRowArray[arcs]
+        isEdgeArc = arcs < network.numArcs
+        # Rank each edge by its most attractive parallel arc, so the candidates are spread over k neighbours
+        edgeScores = attractivenessArray[:network.numArcs].reshape(network.numEdges, network.numArcCaps).max(axis=1)
+        slotEdges = np.where(isEdgeArc, arcs // network.numArcCaps, -1)
+        slotScores = np.where(isEdgeArc, edgeScores[np.maximum(slotEdges, 0)], 0.0)
+        # Sort each row's edge arcs first, from the most to the least attractive edge (NOTE: The rows keep their offsets)
+        order = np.lexsort((slotEdges, -slotScores, ~isEdgeArc, rows))
+        arcs = arcs[order]
+        rows = rows[order]
+        slotEdges = slotEdges[order]
+        isNewEdge = isEdgeArc[order] & (slotEdges != np.concatenate(([-1], slotEdges[:-1])))
+        numEdgesSoFar = np.cumsum(isNewEdge)
+        edgeRankInRow = numEdgesSoFar - np.concatenate(([0], numEdgesSoFar))[network.adjacencyOffsetsArray[rows]]
+        isCandidate = ((isEdgeArc[order] & (edgeRankInRow <= numCandidateEdges)) | (arcs >= network.sinkArcsOffset) |
+                       ((arcs >= network.sourceArcsOffset) & (arcs < network.returnArcsOffset)))
+        candidateCounts = np.bincount(rows[isCandidate], minlength=len(network.adjacencyOffsetsArray) - 1)
+        candidateOffsets = np.concatenate(([0], np.cumsum(candidateCounts))).astype(np.int64)
+        return candidateOffsets, arcs[isCandidate].astype(np.int64)
+
+    def warmStartPheromone(self, solution: Solution, warmStartStrength=10.0) -> None:
+        """Seeds the pheromone from a solution instead of uniformly, raising each arc's initial pheromone in proportion
+        to the fraction of its capacity the solution uses (NOTE: Call before solving)"""
+        solutionFlows = TourRecord.fromSolution(self.network, solution).getDenseFlows(self.network)
+        initialPheromoneArray = self.initialPheromoneConcentration * (
+                1 + warmStartStrength * solutionFlows / self.network.arcToCapacityArray)
+        initialPheromoneArray[self.network.returnArcsOffset:self.network.sinkArcsOffset] = 0.0
+        self.pheromoneStore = PheromoneStore(initialPheromoneArray)
+
+    def warmStartPheromoneFromRelaxedLP(self, warmStartStrength=10.0) -> Solution:
+        """Solves the LP relaxation of the network and seeds the pheromone from its solution, which is returned"""
+        from src.Solvers.RelaxedLPSolverPDLP import RelaxedLPSolverPDLP  # NOTE: Imported here, as OR-Tools is only needed to warm start
+        relaxedSolver = RelaxedLPSolverPDLP(self.network, self.minTargetFlow)
+        relaxedSolver.updateObjectiveFunction(np.full((self.network.numEdges, self.network.numArcCaps), 1.0))
+        relaxedSolver.solveModel()
+        relaxedSolution = relaxedSolver.writeSolution()
+        if relaxedSolution is not None:  # NOTE: The solver writes no solution if the relaxation is not solved to optimality
+            self.warmStartPheromone(relaxedSolution, warmStartStrength=warmStartStrength)
+        return relaxedSolution
+
+    # =====================================================
+    # ============== CHECKPOINT/RESUME METHODS ==============
+    # =====================================================
+    def saveCheckpoint(self, checkpointName=None) -> None:
+        """Saves the colony's pheromone, incumbent, convergence history, random state and episode counter to an npz"""
+        if checkpointName is None:
+            checkpointName = ("ckpt-" + self.network.name + "_" + str(int(self.minTargetFlow)) + "_Ep" +
+                              str(self.numEpisodesSolved))
+        metadata = self.getFileMetadata()
+        metadata["minTargetFlow"] = self.minTargetFlow
+        metadata["numEpisodesSolved"] = self.numEpisodesSolved
+        metadata["bestKnownCost"] = self.bestKnownCost
+        # NOTE: Saving the seed sequence's spawn count lets a resumed colony draw the same tours as an uninterrupted one
+        metadata["seedEntropy"] = self.seedSequence.entropy
+        metadata["seedSpawnKey"] = list(self.seedSequence.spawn_key)
+        metadata["seedPoolSize"] = self.seedSequence.pool_size
+        metadata["seedChildrenSpawned"] = self.seedSequence.n_children_spawned
+        hasBestRecord = self.bestKnownRecord is not None
+        self.saveColonyFile(checkpointName, metadata,
+                            storedPheromoneArray=self.pheromoneStore.storedPheromoneArray,
+                            pheromoneScale=np.array(self.pheromoneStore.scale),
+                            bestArcIndices=self.bestKnownRecord.arcIndices if hasBestRecord else np.empty(0, dtype=np.int64),
+                            bestArcFlows=self.bestKnownRecord.arcFlows if hasBestRecord else np.empty(0),
+                            convergenceData=np.array(self.convergenceData, dtype=float),
+                            discardedAntsData=np.array(self.discardedAntsData, dtype=np.int64),
+                            stepsData=np.array(self.stepsData, dtype=np.int64),
+                            improvementData=np.array(self.improvementData, dtype=float).reshape(-1, 3))
+
+    def loadCheckpoint(self, checkpointFile: str) -> None:
+        """Restores the colony's state from a checkpoint of a colony on the same network, so a solve resumes from it"""
+        metadata, colonyData = self.loadColonyFile(checkpointFile)
+        if metadata["minTargetFlow"] != self.minTargetFlow:
+            raise ValueError("The checkpoint was saved at a target flow of " + str(metadata["minTargetFlow"]) +
+                             " (NOTE: Use loadPheromone to warm start at a different target flow)")
+        self.pheromoneStore = PheromoneStore(colonyData["storedPheromoneArray"])
+        self.pheromoneStore.scale = float(colonyData["pheromoneScale"])
+        self.bestKnownCost = metadata["bestKnownCost"]
+        self.bestKnownRecord = None
+        if self.bestKnownCost is not None:
+            self.bestKnownRecord = TourRecord(self.bestKnownCost, colonyData["bestArcIndices"], colonyData["bestArcFlows"])
+        self.bestKnownSolution = None
+        self.convergenceData = colonyData["convergenceData"].tolist()
+        self.discardedAntsData = colonyData["discardedAntsData"].tolist()
+        self.stepsData = colonyData["stepsData"].tolist()
+        self.improvementData = [(int(episode), elapsedTime, cost) for episode, elapsedTime, cost in
+                                colonyData["improvementData"].tolist()]
+        self.seedSequence = np.random.SeedSequence(metadata["seedEntropy"], spawn_key=tuple(metadata["seedSpawnKey"]),
+                                                   pool_size=metadata["seedPoolSize"],
+                                                   n_children_spawned=metadata["seedChildrenSpawned"])
+        self.numEpisodesSolved = metadata["numEpisodesSolved"]
+
+    def savePheromone(self, pheromoneName=None) -> None:
+        """Saves the pheromone of every arc number to an npz, which can warm start later solves of the same network"""
+        if pheromoneName is None:
+            pheromoneName = "phero-" + self.network.name + "_" + str(int(self.minTargetFlow))
+        self.saveColonyFile(pheromoneName, self.getFileMetadata(), pheromoneArray=self.pheromoneStore.getPheromoneArray())
+
+    def loadPheromone(self, pheromoneFile: str) -> None:
+        """Loads a saved pheromone map of the same network as the initial pheromone (NOTE: The target flow may differ)"""
+        metadata, colonyData = self.loadColonyFile(pheromoneFile)
+        self.pheromoneStore = PheromoneStore(colonyData["pheromoneArray"])
+
+    def getFileMetadata(self) -> dict:
+        """Returns the metadata that identifies the network a colony file belongs to"""
+        return {"networkName": self.network.name, "numAdjacencyArcs": self.network.numAdjacencyArcs}
+
+    def saveColonyFile(self, fileName: str, metadata: dict, **colonyArrays) -> None:
+        """Saves the metadata and arrays of the colony to a compressed npz in the colony instances directory"""
+        # Path management
+        currDir = os.getcwd()
+        colonyDir = os.path.join(currDir, "../colonyInstances")
+        os.makedirs(colonyDir, exist_ok=True)
+        catPath = os.path.join(colonyDir, fileName + ".npz")
+        print("Saving " + fileName + ".npz to: " + catPath)
+        # Compressed NumPy dump (NOTE: The metadata is stored as a JSON string, so no pickling is needed to load)
+        np.savez_compressed(catPath, metadata=np.array(json.dumps(metadata)), **colonyArrays)
+
+    def loadColonyFile(self, colonyFile: str) -> tuple:
+        """Loads the metadata and arrays of a colony file, checking it belongs to the colony's network"""
+        # Path management
+        currDir = os.getcwd()
+        catPath = os.path.join(currDir, "../colonyInstances", colonyFile)
+        print("Loading " + colonyFile + " from: " + catPath)
+        with np.load(catPath) as colonyFileData:
+            colonyData = {arrayName: colonyFileData[arrayName] for arrayName in colonyFileData.files}
+        metadata = json.loads(str(colonyData["metadata"]))
+        if metadata["networkName"] != self.network.name or metadata["numAdjacencyArcs"] != self.network.numAdjacencyArcs:
+            raise ValueError(colonyFile + " was saved for network " + str(metadata["networkName"]) + ", not " +
+                             str(self.network.name))
+        return metadata, colonyData
+
+    def getAntClass(self) -> type:
+        """Returns the ant class of the selected tour construction engine"""
+        if self.engine == "python":
+            return Ant
+        elif self.engine == "numba":
+            return NumbaAnt
+        else:
+            raise ValueError("Unknown tour construction engine: " + str(self.engine))
 
     def initializePopulation(self) -> list:
         """Initializes the population with ants objects"""
         population = []
+        if self.engine == "batch":
+            return population
+        antClass = self.getAntClass()
         for n in range(self.numAnts):
-            thisAnt = Ant(self.network, self.minTargetFlow, self.alpha, self.beta)
+            thisAnt = antClass(self.network, self.minTargetFlow, isPruningDeadEnds=self.isPruningDeadEnds)
             population.append(thisAnt)
         return population
 
-    def initializePheromoneDict(self) -> dict:
-        """Adds all possible arcs and supersource/sink as keys to the pheromone dictionary"""
-        pheromoneDict = {}
-        # For all edge, cap pairs, initialize with one
-        for edge in self.network.edgesArray:
-            for cap in self.network.possibleArcCapsArray:
-                pheromoneDict[(edge[0], edge[1], cap)] = self.initialPheromoneConcentration
-        # For all supersource -> source and visa versa, initialize with zero
-        for srcIndex in range(self.network.numSources):
-            source = self.network.sourcesArray[srcIndex]
-            cap = self.network.sourceCapsArray[srcIndex]
-            pheromoneDict[(-1, source, cap)] = self.initialPheromoneConcentration
-            pheromoneDict[(source, -1, -1)] = 0.0
-        # For all supersink -> sink, initialize with zero (NOTE: You can't go back from a supersink)
-        for sinkIndex in range(self.network.numSinks):
-            sink = self.network.sinksArray[sinkIndex]
-            cap = self.network.sinkCapsArray[sinkIndex]
-            pheromoneDict[(sink, -2, cap)] = self.initialPheromoneConcentration
-        return pheromoneDict
+    def initializeAntBatch(self) -> AntBatch:
+        """Initializes the lock-step batch of ants if the batch engine is selected"""
+        if self.engine == "batch":
+            return AntBatch(self.network, self.minTargetFlow, self.numAnts)
+        return None
+
+    def initializePheromoneStore(self) -> PheromoneStore:
+        """Initializes the pheromone of every arc number, where source -> supersource arcs start with zero"""
+        initialPheromoneArray = np.full(self.network.numAdjacencyArcs, float(self.initialPheromoneConcentration))
+        initialPheromoneArray[self.network.returnArcsOffset:self.network.sinkArcsOffset] = 0.0
+        return PheromoneStore(initialPheromoneArray)
 
     def initializeGoodnessOfArcDict(self) -> dict:
         """Adds all possible arcs and supersource/sink as keys to the pheromone dictionary with a value of 1/(FixedCost + VariableCost)"""
         arcGoodnessScalar = 10  # Based off the magnitude of the arc costs (~10^2)
         arcGoodnessDict = {}
         # For all edge, cap pairs, initialize with one
-        for edge in self.network.edgesArray:
-            for cap in self.network.possibleArcCapsArray:
-                arcObj = self.network.arcsDict[(edge[0], edge[1], cap)]
+        for edgeIndex, edge in enumerate(self.network.edgesArray):
+            for capIndex, cap in enumerate(self.network.possibleArcCapsArray):
+                arc = edgeIndex * self.network.numArcCaps + capIndex  # Arc number, which indexes the network's cost arrays
+                arcCost = self.network.arcToFixedCostArray[arc] + self.network.arcToVariableCostArray[arc]
                 # OLD: arcGoodness = arcGoodnessScalar / (arcObj.fixedCost + arcObj.variableCost)
-                arcGoodness = (arcGoodnessScalar * cap) / (arcObj.fixedCost + arcObj.variableCost)
+                arcGoodness = (arcGoodnessScalar * cap) / arcCost
                 arcGoodnessDict[(edge[0], edge[1], cap)] = arcGoodness
         # For all supersource -> source and visa versa, initialize with zero
         for srcIndex in range(self.network.numSources):
             source = self.network.sourcesArray[srcIndex]
-            cap = self.network.sourceCapsArray[srcIndex]
-            variableCost = self.network.sourceVariableCostsArray[srcIndex]
+            cap = self.network.arcToCapacityArray[self.network.sourceArcsOffset + srcIndex]
+            variableCost = self.getGoodnessVariableCost(self.network.arcToVariableCostArray[self.network.sourceArcsOffset + srcIndex])
             # OLD: srcGoodness = arcGoodnessScalar / variableCost
-            srcGoodness = (cap * arcGoodnessScalar) / variableCost
+            srcGoodness = (self.getGoodnessCapacity(cap) * arcGoodnessScalar) / variableCost
             arcGoodnessDict[(-1, source, cap)] = srcGoodness
             arcGoodnessDict[(source, -1, -1)] = 0.0  # NOTE: MAKES THE "GOODNESS" OF MOVING SOURCE -> SUPERSOURCE ZERO
         # For all supersink -> sink, initialize with zero (NOTE: You can't go back from a supersink)
         for sinkIndex in range(self.network.numSinks):
             sink = self.network.sinksArray[sinkIndex]
-            cap = self.network.sinkCapsArray[sinkIndex]
-            variableCost = self.network.sinkVariableCostsArray[sinkIndex]
+            cap = self.network.arcToCapacityArray[self.network.sinkArcsOffset + sinkIndex]
+            variableCost = self.getGoodnessVariableCost(self.network.arcToVariableCostArray[self.network.sinkArcsOffset + sinkIndex])
             # OLD: sinkGoodness = arcGoodnessScalar * 10 / variableCost
-            sinkGoodness = (cap * arcGoodnessScalar ** 2) / variableCost  # SCALAR^2 CREDITS SINK -> SUPERSINK MOVES
+            sinkGoodness = (self.getGoodnessCapacity(cap) * arcGoodnessScalar ** 2) / variableCost  # SCALAR^2 CREDITS SINK -> SUPERSINK MOVES
             arcGoodnessDict[(sink, -2, cap)] = sinkGoodness
         return arcGoodnessDict
 
+    def getGoodnessCapacity(self, cap: int) -> float:
+        """Returns the capacity a source/sink arc is rated by, which is the target flow if the sources/sinks are uncapacitated"""
+        if self.network.isSourceSinkCapacitated is False:
+            return self.minTargetFlow  # NOTE: The MAX_INT capacity of an uncapacitated source/sink would swamp every other weight
+        return cap
+
+    def getGoodnessVariableCost(self, variableCost: float) -> float:
+        """Returns the variable cost a source/sink arc is rated by, which is one if the sources/sinks are uncharged"""
+        if self.network.isSourceSinkCharged is False:
+            return 1.0  # NOTE: The zero cost of an uncharged source/sink would make its goodness infinite
+        return variableCost
+
+    def initializeGoodnessOfArcArray(self) -> ndarray:
+        """Orders the goodness dictionary on arc number so it can be combined with the pheromone as an array"""
+        return np.array([self.goodnessDict[arcKey] for arcKey in self.network.arcKeysList])
+
     def resetAllAnts(self) -> None:
         """Resets the tour/solution attributes for all the ants in the population"""
         for ant in self.population:
@@ -0,0 +1,21 @@
+from src.ACO.TourRecord import TourRecord
+from src.Network.FlowNetwork import FlowNetwork
+from src.Network.Solution import Solution
+
+
+class ColonyImprovement:
+    """Class that describes one improvement of a colony's best known cost, as yielded while the colony solves"""
+
+    def __init__(self, network: FlowNetwork, minTargetFlow: float, episode: int, elapsedTime: float,
+                 tourRecord: TourRecord):
+        """Constructor of a Colony Improvement instance"""
+        self.network = network
+        self.minTargetFlow = minTargetFlow
+        self.episode = episode  # Episode the improvement was found in
+        self.elapsedTime = elapsedTime  # Seconds since the solve started when the episode finished
+        self.trueCost = tourRecord.trueCost  # Improved best known cost
+        self.tourRecord = tourRecord  # Lightweight handle to the improved solution (i.e. its cost and sparse arc flows)
+
+    def getSolution(self) -> Solution:
+        """Writes the improved solution to a Solution instance (NOTE: Only built when asked for)"""
+        return self.tourRecord.writeSolution(self.network, self.minTargetFlow)
@@ -0,0 +1,127 @@
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+
+import numpy as np
+
+from src.ACO.Colony import Colony
+from src.ACO.TourRecord import TourRecord
+from src.Network.FlowNetwork import FlowNetwork
+from src.Network.Solution import Solution
+
+
+def runIsland(connection: Connection, network: FlowNetwork, minTargetFlow: float, numAnts: int, seed: int,
+              hyperparameters: dict, colonyOptions: dict) -> None:
+    """Runs one island's colony in its own process, solving a block of episodes per message until told to stop"""
+    colony = Colony(network, minTargetFlow, numAnts, 0, seed=seed, **colonyOptions)
+    for hyperparameter, value in hyperparameters.items():
+        setattr(colony, hyperparameter, value)
+    while True:
+        message = connection.recv()
+        if message is None:  # Stop the island
+            break
+        numEpisodes, migrant, pheromoneArray, blendWeight = message
+        # Adopt the migrant and blend pheromone before solving this block of episodes
+        colony.receiveMigrant(migrant)
+        if pheromoneArray is not None:
+            colony.pheromoneStore.blendPheromone(pheromoneArray, blendWeight)
+        numPreviousEpisodes = len(colony.convergenceData)
+        colony.numEpisodes = colony.numEpisodesSolved + numEpisodes  # Solves this block after the episodes already solved
+        colony.solveNetwork(drawing=False)
+        islandPheromone = colony.pheromoneStore.getPheromoneArray() if blendWeight > 0.0 else None
+        connection.send((colony.bestKnownRecord, colony.convergenceData[numPreviousEpisodes:], islandPheromone))
+
+
+class IslandModel:
+    """Class that runs several independent colonies (i.e. islands) in their own processes, which exchange their best
+    solutions every few episodes"""
+
+    # =========================================
+    # ============== CONSTRUCTOR ==============
+    # =========================================
+    def __init__(self, network: FlowNetwork, minTargetFlow: float, numAnts: int, numEpisodes: int,
+                 islandHyperparameters: list, migrationInterval=5, pheromoneBlendWeight=0.0, seed=None,
+                 colonyOptions=None):
+        """Constructor of an Island Model instance"""
+        # Input Attributes
+        self.network = network
+        self.minTargetFlow = minTargetFlow
+        self.numAnts = numAnts  # Number of ants in each island's colony
+        self.numEpisodes = numEpisodes  # Number of episodes each island solves in total
+        self.islandHyperparameters = islandHyperparameters  # Colony attributes set on each island (e.g. {"alpha": 1, "beta": 10, "evaporationRate": 0.75, "Q": 20})
+        self.numIslands = len(islandHyperparameters)
+        self.migrationInterval = migrationInterval  # Number of episodes between the exchanges of best solutions
+        self.pheromoneBlendWeight = pheromoneBlendWeight  # How far each island's pheromone is moved towards the islands' mean at an exchange (NOTE: 0 = no blending)
+        self.seed = seed  # Seed that every island's seed is spawned from (NOTE: None is irreproducible)
+        if colonyOptions is None:
+            colonyOptions = {}  # Keyword arguments passed to the constructor of each island's colony (e.g. engine)
+        self.colonyOptions = colonyOptions
+
+        # Island Model Attributes
+        self.bestKnownCost = None  # Stores the lowest cost solution found by any island so far
+        self.bestKnownRecord = None  # Stores the compact tour record of the global best solution
+        self.bestIslandIndex = None  # Island that found the global best solution
+        self.islandRecords = [None] * self.numIslands  # Stores the best tour record of each island
+        self.islandConvergenceData = [[] for island in range(self.numIslands)]  # Stores the best known cost of each island after each of its episodes
+        self.convergenceData = []  # Stores the global best known cost after each exchange
+
+    def solveNetwork(self) -> Solution:
+        """Main loop that solves the Flow Network instance with every island, exchanging best solutions in a ring"""
+        islandSeeds = [int(seed.generate_state(1)[0]) for seed in np.random.SeedSequence(self.seed).spawn(self.numIslands)]
+        connections = []
+        processes = []
+        try:
+            # Start each island's process, which builds its colony once
+            for island in range(self.numIslands):
+                parentConnection, childConnection = Pipe()
+                process = Process(target=runIsland, args=(childConnection, self.network, self.minTargetFlow,
+                                                          self.numAnts, islandSeeds[island],
+                                                          self.islandHyperparameters[island], self.colonyOptions),
+                                  daemon=True)
+                process.start()
+                childConnection.close()  # Only the island holds its end, so the loop sees an error if the island dies
+                connections.append(parentConnection)
+                processes.append(process)
+            # EXCHANGE LOOP
+            migrants = [None] * self.numIslands
+            meanPheromone = None
+            episodesSolved = 0
+            while episodesSolved < self.numEpisodes:
+                numEpisodes = min(self.migrationInterval, self.numEpisodes - episodesSolved)
+                # Have every island solve the next block of episodes in parallel
+                for island in range(self.numIslands):
+                    connections[island].send((numEpisodes, migrants[island], meanPheromone, self.pheromoneBlendWeight))
+                islandPheromones = []
+                for island in range(self.numIslands):
+                    islandRecord, islandConvergence, islandPheromone = connections[island].recv()
+                    self.islandRecords[island] = islandRecord
+                    self.islandConvergenceData[island].extend(islandConvergence)
+                    islandPheromones.append(islandPheromone)
+                    self.updateBestSolution(island, islandRecord)
+                episodesSolved += numEpisodes
+                self.convergenceData.append(self.bestKnownCost)
+                # print("Exchange after " + str(episodesSolved) + " episodes: Best = " + str(self.bestKnownCost))  # PRINT OPTION
+                # Each island receives the best solution of the island before it in the ring
+                migrants = [self.islandRecords[island - 1] for island in range(self.numIslands)]
+                if self.pheromoneBlendWeight > 0.0:
+                    meanPheromone = np.mean(islandPheromones, axis=0)
+            for connection in connections:
+                connection.send(None)
+        finally:
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+        return self.getBestSolution()
+
+    def updateBestSolution(self, island: int, islandRecord: TourRecord) -> None:
+        """Updates the global best if the island's best solution is better"""
+        if islandRecord is not None and (self.bestKnownCost is None or islandRecord.trueCost < self.bestKnownCost):
+            self.bestKnownCost = islandRecord.trueCost
+            self.bestKnownRecord = islandRecord
+            self.bestIslandIndex = island
+
+    def getBestSolution(self) -> Solution:
+        """Writes the global best solution to a Solution instance"""
+        if self.bestKnownRecord is None:
+            return None
+        return self.bestKnownRecord.writeSolution(self.network, self.minTargetFlow)
@@ -0,0 +1,248 @@
+import numpy as np
+from numpy import ndarray
+
+from src.ACO.Ant import Ant
+from src.Network.FlowNetwork import FlowNetwork
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, as the pure-Python Ant remains the reference engine
+    njit = None
+
+
+def constructTour(adjacencyOffsets: ndarray, adjacencyArcs: ndarray, adjacencyDegrees: ndarray, arcToSlot: ndarray,
+                  arcToRow: ndarray, arcToTail: ndarray, arcToHead: ndarray, incomingOffsets: ndarray,
+                  incomingArcs: ndarray, sinks: ndarray, sinkArcsOffset: int, capacityTemplate: ndarray,
+                  availableCapacity: ndarray, assignedFlow: ndarray, frontierArcs: ndarray, frontierCounts: ndarray,
+                  frontierSlots: ndarray, attractiveness: ndarray, numTotalNodes: int, maxDegree: int,
+                  minTargetFlow: float, isPruningDeadEnds: bool, sourceArcsOffset: int, numSources: int,
+                  numEdges: int, numArcCaps: int, edgeToReverseEdge: ndarray, edgeMinFixedCosts: ndarray,
+                  edgeMinVariableCosts: ndarray, minSourceVariableCost: float, sinkVariableCosts: ndarray,
+                  minSinkVariableCost: float, costToBeat: float,
+                  isUsingCandidates: bool, candidateOffsets: ndarray, candidateArcs: ndarray, seed: int) -> tuple:
+    """Runs the trip/tour loop of Ant.findSolution over the flat adjacency arrays (NOTE: Compiled with Numba below)"""
+    np.random.seed(seed)
+    # Tour attributes (NOTE: The ant's preallocated arrays are reset in place)
+    availableCapacity[:] = capacityTemplate
+    assignedFlow[:] = 0.0
+    frontierArcs[:] = adjacencyArcs
+    frontierCounts[:] = adjacencyDegrees
+    frontierSlots[:] = arcToSlot
+    remainingFlowToAssign = minTargetFlow
+    time = 0
+    numTrips = 0
+    # Trip attributes (NOTE: A trip visits each node at most once, plus one supersource return per source visited)
+    tripStack = np.empty(2 * numTotalNodes + 2, dtype=np.int64)
+    nodesVisitedThisTrip = np.zeros(numTotalNodes, dtype=np.bool_)
+    options = np.empty(maxDegree, dtype=np.int64)
+    cumulativeWeights = np.empty(maxDegree)
+    # Reachability attributes (NOTE: Recomputed only when an arc has saturated since the last search)
+    canReachSink = np.zeros(numTotalNodes, dtype=np.bool_)
+    searchQueue = np.empty(numTotalNodes, dtype=np.int64)
+    isReachabilityStale = True
+    # Cost bound attributes (NOTE: An infinite cost to beat never aborts)
+    edgeTotals = np.empty(numEdges)
+    tourCostBound = 0.0
+    # TOUR LOOP
+    while remainingFlowToAssign > 0.0:
+        # PRE-TRIP SETUP
+        currentPosition = -1
+        tripDepth = 0
+        nodesVisitedThisTrip[:] = False
+        hasBacktracked = False
+        # TRIP LOOP
+        while currentPosition != -2:
+            # Get options for next move from the live arcs of the frontier (NOTE: The supersource is the last row)
+            row = currentPosition if currentPosition >= 0 else numTotalNodes
+            rowStart = adjacencyOffsets[row]
+            numOptions = 0
+            if isPruningDeadEnds:
+                if isReachabilityStale:
+                    # Reverse BFS from the sinks with capacity over the non-saturated arcs
+                    canReachSink[:] = False
+                    queueEnd = 0
+                    for t in range(sinks.shape[0]):
+                        if availableCapacity[sinkArcsOffset + t] > 0.0:
+                            canReachSink[sinks[t]] = True
+                            searchQueue[queueEnd] = sinks[t]
+                            queueEnd += 1
+                    isSupersourceReached = False
+                    queueStart = 0
+                    while queueStart < queueEnd:
+                        node = searchQueue[queueStart]
+                        queueStart += 1
+                        for k in range(incomingOffsets[node], incomingOffsets[node + 1]):
+                            arc = incomingArcs[k]
+                            if availableCapacity[arc] > 0.0 and not canReachSink[arcToTail[arc]]:
+                                canReachSink[arcToTail[arc]] = True
+                                searchQueue[queueEnd] = arcToTail[arc]
+                                queueEnd += 1
+                        if queueStart == queueEnd and not isSupersourceReached:
+                            # Once a supplied source reaches a sink, every source does by returning to the supersource
+                            for s in range(numSources):
+                                if (availableCapacity[sourceArcsOffset + s] > 0.0 and
+                                        canReachSink[arcToHead[sourceArcsOffset + s]]):
+                                    isSupersourceReached = True
+                            if isSupersourceReached:
+                                for s in range(numSources):
+                                    source = arcToHead[sourceArcsOffset + s]
+                                    if not canReachSink[source]:
+                                        canReachSink[source] = True
+                                        searchQueue[queueEnd] = source
+                                        queueEnd += 1
+                    isReachabilityStale = False
+            if isUsingCandidates and not hasBacktracked:
+                # Only the live candidates are options, unless every candidate is saturated (or a dead end)
+                # NOTE: The candidates are dropped after the trip's first backtrack, as they led the ant into a dead end/cycle
+                for i in range(candidateOffsets[row], candidateOffsets[row + 1]):
+                    arc = candidateArcs[i]
+                    if availableCapacity[arc] > 0.0 and (not isPruningDeadEnds or arcToHead[arc] < 0 or
+                                                         canReachSink[arcToHead[arc]]):
+                        options[numOptions] = arc
+                        numOptions += 1
+            if numOptions == 0 and isPruningDeadEnds:
+                # Exclude moves into dead ends (NOTE: Moves to the supersource/sink are always kept)
+                for i in range(frontierCounts[row]):
+                    arc = frontierArcs[rowStart + i]
+                    if arcToHead[arc] < 0 or canReachSink[arcToHead[arc]]:
+                        options[numOptions] = arc
+                        numOptions += 1
+            # Fall back to all live arcs if pruning is off or every option is a dead end
+            if numOptions == 0:
+                numOptions = frontierCounts[row]
+                for i in range(numOptions):
+                    options[i] = frontierArcs[rowStart + i]
+            if numOptions == 0:
+                raise ValueError("Ant has no arc with available capacity to traverse")
+            # Probabilistically choose a next arc
+            if numOptions == 1 and arcToHead[options[0]] == -1:
+                arcChoice = options[0]
+            else:
+                totalWeight = 0.0
+                for i in range(numOptions):
+                    totalWeight += attractiveness[options[i]]
+                    cumulativeWeights[i] = totalWeight
+                if not np.isfinite(totalWeight) or totalWeight <= 0.0:  # Zero or overflowed weights are chosen uniformly
+                    arcChoice = options[np.random.randint(numOptions)]
+                else:
+                    rng = np.random.random() * totalWeight
+                    choice = np.searchsorted(cumulativeWeights[:numOptions], rng, side="right")
+                    arcChoice = options[min(choice, numOptions - 1)]  # NOTE: Options past numOptions are stale, so never read them
+            # Move the ant across the arc, undoing the trip back to the node if it was already visited
+            time += 1
+            arcHead = arcToHead[arcChoice]
+            if arcHead >= 0 and nodesVisitedThisTrip[arcHead]:
+                while arcToHead[tripStack[tripDepth - 1]] != arcHead:
+                    tripDepth -= 1
+                    poppedPrevMove = tripStack[tripDepth]
+                    currentPosition = arcToTail[poppedPrevMove]
+                    nodesVisitedThisTrip[arcToHead[poppedPrevMove]] = False
+                hasBacktracked = True
+            else:
+                currentPosition = arcHead
+                if arcHead >= 0:
+                    nodesVisitedThisTrip[arcHead] = True
+                tripStack[tripDepth] = arcChoice
+                tripDepth += 1
+        # POST-TRIP ACCOUNTING
+        minAvailableCapacityDuringTrip = remainingFlowToAssign
+        for i in range(tripDepth):
+            if availableCapacity[tripStack[i]] < minAvailableCapacityDuringTrip:
+                minAvailableCapacityDuringTrip = availableCapacity[tripStack[i]]
+        for i in range(tripDepth):
+            availableCapacity[tripStack[i]] -= minAvailableCapacityDuringTrip
+            assignedFlow[tripStack[i]] += minAvailableCapacityDuringTrip
+        remainingFlowToAssign -= minAvailableCapacityDuringTrip
+        # Swap each saturated arc behind the live arcs of its frontier row
+        for i in range(tripDepth):
+            arc = tripStack[i]
+            if availableCapacity[arc] <= 0.0:
+                row = arcToRow[arc]
+                slot = frontierSlots[arc]
+                lastSlot = adjacencyOffsets[row] + frontierCounts[row] - 1
+                lastArc = frontierArcs[lastSlot]
+                frontierArcs[slot] = lastArc
+                frontierSlots[lastArc] = slot
+                frontierArcs[lastSlot] = arc
+                frontierSlots[arc] = lastSlot
+                frontierCounts[row] -= 1
+                isReachabilityStale = True
+        numTrips += 1
+        if time > 100000:  # Restart if timed out
+            print("Restarting ant!")
+            availableCapacity[:] = capacityTemplate
+            assignedFlow[:] = 0.0
+            frontierArcs[:] = adjacencyArcs
+            frontierCounts[:] = adjacencyDegrees
+            frontierSlots[:] = arcToSlot
+            isReachabilityStale = True
+            remainingFlowToAssign = minTargetFlow
+            time = 0
+            numTrips = 0
+        # Abandon the tour if the costs its flow can never shed plus the cheapest cost of the rest cannot beat the incumbent
+        # NOTE: A later trip crosses an edge pair at most once, so the remaining flow can cancel at most that much of its net flow
+        if costToBeat < np.inf and remainingFlowToAssign > 0.0:
+            tourCostBound = minTargetFlow * minSourceVariableCost + remainingFlowToAssign * minSinkVariableCost
+            for sinkIndex in range(sinks.shape[0]):
+                tourCostBound += sinkVariableCosts[sinkIndex] * assignedFlow[sinkArcsOffset + sinkIndex]
+            for edge in range(numEdges):
+                edgeTotals[edge] = 0.0
+                for arc in range(edge * numArcCaps, (edge + 1) * numArcCaps):
+                    edgeTotals[edge] += assignedFlow[arc]
+            for edge in range(numEdges):
+                uncancellableFlow = edgeTotals[edge] - edgeTotals[edgeToReverseEdge[edge]] - remainingFlowToAssign
+                if uncancellableFlow > 0.0:
+                    tourCostBound += edgeMinFixedCosts[edge] + edgeMinVariableCosts[edge] * uncancellableFlow
+            if tourCostBound >= costToBeat:
+                return time, numTrips, True, tourCostBound
+    return time, numTrips, False, tourCostBound
+
+
+if njit is not None:
+    constructTourJIT = njit(cache=True)(constructTour)
+else:
+    constructTourJIT = None
+
+
+class NumbaAnt(Ant):
+    """Class that defines an Ant whose tour construction is compiled with Numba (NOTE: Ant is the reference engine)"""
+
+    def __init__(self, network: FlowNetwork, minTargetFlow: float, isPruningDeadEnds=False):
+        """Constructor of a Numba Ant instance"""
+        if constructTourJIT is None:
+            raise ImportError("Numba must be installed to use the numba tour construction engine")
+        super().__init__(network, minTargetFlow, isPruningDeadEnds=isPruningDeadEnds)
+        self.maxDegree = int(self.network.adjacencyDegreesArray.max())  # Size of the compiled loop's option buffer
+
+    def findSolution(self, attractivenessArray: ndarray, seed=None, costToBeat=None, candidateLists=None) -> None:
+        """Has the compiled tour loop explore the graph space until a feasible solution is discovered"""
+        self.attractivenessArray = attractivenessArray
+        self.costToBeat = costToBeat
+        self.candidateOffsetsArray, self.candidateArcsArray = candidateLists if candidateLists is not None else (None, None)
+        # NOTE: Without candidate lists, the compiled loop is given empty arrays that it never reads
+        isUsingCandidates = candidateLists is not None
+        candidateOffsets, candidateArcs = (candidateLists if isUsingCandidates is True else
+                                           (np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int64)))
+        # Derive the compiled loop's integer seed from the seed given by the colony
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        jitSeed = int(seed.generate_state(1)[0])
+        self.time, self.numTrips, isTourAborted, self.tourCostBound = constructTourJIT(
+            self.network.adjacencyOffsetsArray, self.network.adjacencyArcsArray, self.network.adjacencyDegreesArray,
+            self.network.arcToSlotArray, self.network.arcToRowArray, self.network.arcToTailArray,
+            self.network.arcToHeadArray, self.network.incomingOffsetsArray, self.network.incomingArcsArray,
+            self.network.sinksArray.astype(np.int64), self.network.sinkArcsOffset, self.network.capacityTemplateArray,
+            self.availableCapacityArray, self.assignedFlowArray, self.frontierArcsArray, self.frontierCountsArray,
+            self.frontierSlotsArray, attractivenessArray, self.network.numTotalNodes, self.maxDegree,
+            float(self.minTargetFlow), self.isPruningDeadEnds, self.network.sourceArcsOffset, self.network.numSources,
+            self.network.numEdges, self.network.numArcCaps, self.network.edgeToReverseEdgeArray,
+            self.edgeMinFixedCostsArray, self.edgeMinVariableCostsArray, float(self.minSourceVariableCost),
+            self.sinkVariableCostsArray, float(self.minSinkVariableCost),
+            float(costToBeat) if costToBeat is not None else np.inf, isUsingCandidates, candidateOffsets,
+            candidateArcs, jitSeed)
+        self.isTourAborted = bool(isTourAborted)
+        if self.isTourAborted is True:
+            return
+        self.remainingFlowToAssign = 0.0
+        self.resolveOpposingFlows()  # Eliminates positive flows in opposing directions on every bidirectional edge
+        self.computeResultingNetwork()  # Calculates the cost of the assigned flows
@@ -0,0 +1,88 @@
+import numpy as np
+from numpy import ndarray
+
+
+class PheromoneStore:
+    """Class that stores the pheromone of every arc number as a NumPy vector times a lazily applied global scale"""
+
+    def __init__(self, initialPheromoneArray: ndarray):
+        """Constructor of a Pheromone Store instance"""
+        # NOTE: The pheromone of an arc is (scale * storedPheromoneArray[arc]), so evaporation only shrinks the scale
+        self.storedPheromoneArray = np.array(initialPheromoneArray, dtype=float)  # Pheromone of every arc number, up to the global scale
+        self.scale = 1.0  # Global scale factor that evaporation is applied to
+        self.minScale = 1e-100  # Scale at which the stored pheromone is renormalized, which is well above the underflow of a float
+        self.changedArcs = None  # Arc numbers whose stored pheromone changed since they were last taken (NOTE: None = every arc)
+        self.maxStoredPheromone = self.getMaxStoredPheromone()  # Largest stored pheromone, kept up to date by the deposits
+
+    def evaporatePheromone(self, evaporationRate: float) -> None:
+        """Evaporates pheromone using (1-rho)*pheromone across every arc by shrinking the global scale"""
+        self.scale *= (1 - evaporationRate)
+        if self.scale < self.minScale:
+            self.renormalizePheromone()
+
+    def depositPheromone(self, arcIndices: ndarray, amounts: ndarray) -> None:
+        """Adds the amounts of pheromone to the arc numbers, touching only those arcs"""
+        np.add.at(self.storedPheromoneArray, arcIndices, np.asarray(amounts) / self.scale)
+        if len(arcIndices) > 0:
+            self.maxStoredPheromone = max(self.maxStoredPheromone, float(self.storedPheromoneArray[arcIndices].max()))
+        if self.changedArcs is not None:
+            self.changedArcs.append(arcIndices)
+
+    def blendPheromone(self, pheromoneArray: ndarray, blendWeight: float) -> None:
+        """Moves the pheromone of every arc the blend weight of the way towards the given pheromone"""
+        self.renormalizePheromone()
+        self.storedPheromoneArray *= (1 - blendWeight)
+        self.storedPheromoneArray += blendWeight * pheromoneArray
+        self.maxStoredPheromone = self.getMaxStoredPheromone()
+
+    def capStoredPheromone(self, maxStoredPheromone: float) -> None:
+        """Divides the stored pheromone by its largest value once that exceeds the cap, folding the divisor into the global
+        scale (NOTE: Changes the stored pheromone of every arc)"""
+        # NOTE: Deposits are divided by the shrinking scale, so the stored pheromone grows every episode
+        if self.maxStoredPheromone > maxStoredPheromone:
+            self.storedPheromoneArray /= self.maxStoredPheromone
+            self.scale *= self.maxStoredPheromone
+            self.maxStoredPheromone = 1.0
+            self.changedArcs = None
+
+    def renormalizePheromone(self) -> None:
+        """Folds the global scale into the stored pheromone (NOTE: Changes the stored pheromone of every arc)"""
+        if self.scale > 0.0:
+            self.storedPheromoneArray *= self.scale
+        else:
+            self.storedPheromoneArray[:] = 0.0  # Complete evaporation (i.e. rho = 1) leaves no pheromone
+        self.scale = 1.0
+        self.changedArcs = None
+        self.maxStoredPheromone = self.getMaxStoredPheromone()
+
+    def popChangedArcs(self) -> ndarray:
+        """Returns the arc numbers whose stored pheromone changed since the last call (NOTE: None = every arc)"""
+        if self.changedArcs is None:
+            changedArcs = None
+        elif len(self.changedArcs) == 0:
+            changedArcs = np.empty(0, dtype=np.int64)
+        else:
+            changedArcs = np.unique(np.concatenate(self.changedArcs))
+        self.changedArcs = []
+        return changedArcs
+
+    def getMaxStoredPheromone(self) -> float:
+        """Returns the largest stored pheromone of any arc number (NOTE: Scans every arc)"""
+        return float(self.storedPheromoneArray.max()) if len(self.storedPheromoneArray) > 0 else 0.0
+
+    def getPheromoneArray(self) -> ndarray:
+        """Returns the true pheromone of every arc number (NOTE: Applies the scale to every arc)"""
+        return self.storedPheromoneArray * self.scale
+
+    def getPheromoneEntropy(self) -> float:
+        """Returns the Shannon entropy of the pheromone distribution over arc numbers, normalized to [0, 1]"""
+        # NOTE: The global scale cancels out, and low entropy means the pheromone is concentrated on few arcs
+        totalPheromone = self.storedPheromoneArray.sum()
+        if totalPheromone <= 0.0:
+            return 0.0
+        probabilities = self.storedPheromoneArray[self.storedPheromoneArray > 0.0] / totalPheromone
+        return float(-np.sum(probabilities * np.log(probabilities)) / np.log(len(self.storedPheromoneArray)))
+
+    def getPheromone(self, arcNumber: int) -> float:
+        """Returns the true pheromone of a single arc number"""
+        return float(self.storedPheromoneArray[arcNumber] * self.scale)
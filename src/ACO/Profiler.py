@@ -0,0 +1,160 @@
+import csv
+import json
+import time
+
+from src.ACO.Ant import Ant
+
+
+class Profiler:
+    """Class that counts and times the phases of the ACO by wrapping the methods of attached colonies and ants, so
+    nothing is measured (or slowed down) unless a profiler is attached"""
+
+    # NOTE: Phase times are inclusive, so a tour's findSolution time also contains the time of its inner phases
+    antPhases = ["findSolution", "getPossibleNextMoves", "decideArcToTraverse", "travelArc", "assignTripFlow",
+                 "updateReachability", "computeTourCostBound", "resolveOpposingFlows", "computeResultingNetwork"]
+    colonyPhases = ["solveEpisodeTours", "updateBestSolution", "evaporatePheromone", "depositPheromone",
+                    "updateAttractiveness"]
+
+    def __init__(self):
+        """Constructor of a Profiler instance"""
+        self.phaseData = {}  # Dictionary indexed on phase name with value [number of calls, total seconds]
+        self.tourData = []  # Stores a dictionary of the counts of every tour built by an attached ant
+        self.wrappedMethods = []  # Stores the (object, method name) of every wrapped method, which detach() restores
+        self.colony = None  # Colony the profiler is attached to, which the episode of each tour is read from
+
+    # ===================================================
+    # ============== ATTACH/DETACH METHODS ==============
+    # ===================================================
+    def attachToColony(self, colony) -> None:
+        """Wraps the colony's phases and those of every ant in its population (NOTE: The ants of worker processes and
+        of the batch engine are not reached, so only the colony's phases are profiled for them)"""
+        self.colony = colony
+        for phase in self.colonyPhases:
+            self.wrapMethod(colony, phase, "Colony." + phase)
+        for antIndex in range(len(colony.population)):
+            self.attachToAnt(colony.population[antIndex], antIndex=antIndex)
+
+    def attachToAnt(self, ant: Ant, antIndex=0) -> None:
+        """Wraps the ant's phases and records the steps, trips, backtracks and restarts of every tour it builds
+        (NOTE: The compiled loop of a Numba ant only reports its tour's steps and trips)"""
+        for phase in self.antPhases:
+            if phase != "findSolution":
+                self.wrapMethod(ant, phase, "Ant." + phase)
+        tourCounts = {"backtracks": 0, "restarts": 0, "isInTour": False}
+        # Count a backtrack whenever traveling an arc shortens the trip stack
+        travelArc = getattr(ant, "travelArc")
+
+        def countedTravelArc(arcChoice):
+            tripDepth = len(ant.tripStack)
+            travelArc(arcChoice)
+            if len(ant.tripStack) < tripDepth:
+                tourCounts["backtracks"] += 1
+
+        setattr(ant, "travelArc", countedTravelArc)
+        # Count a restart whenever the tour is reset while it is being built
+        resetTour = getattr(ant, "resetTourAndSolutionAttributes")
+
+        def countedResetTour():
+            if tourCounts["isInTour"] is True:
+                tourCounts["restarts"] += 1
+            resetTour()
+
+        setattr(ant, "resetTourAndSolutionAttributes", countedResetTour)
+        self.wrappedMethods.append((ant, "resetTourAndSolutionAttributes"))
+        # Record the counts of each tour once it is built
+        findSolution = self.wrapMethod(ant, "findSolution", "Ant.findSolution")
+
+        def recordedFindSolution(*args, **kwargs):
+            tourCounts["backtracks"] = 0
+            tourCounts["restarts"] = 0
+            tourCounts["isInTour"] = True
+            startTime = time.perf_counter()
+            try:
+                findSolution(*args, **kwargs)
+            finally:
+                tourCounts["isInTour"] = False
+            self.tourData.append({"episode": self.colony.numEpisodesSolved if self.colony is not None else 0,
+                                  "ant": antIndex, "steps": ant.time, "trips": ant.numTrips,
+                                  "backtracks": tourCounts["backtracks"], "restarts": tourCounts["restarts"],
+                                  "isAborted": ant.isTourAborted, "cost": ant.trueCost,
+                                  "seconds": time.perf_counter() - startTime})
+
+        setattr(ant, "findSolution", recordedFindSolution)
+
+    def wrapMethod(self, obj, methodName: str, phaseName: str):
+        """Replaces the object's method with one that counts and times its calls, and returns the original method"""
+        method = getattr(obj, methodName)
+        phase = self.phaseData.setdefault(phaseName, [0, 0.0])
+
+        def timedMethod(*args, **kwargs):
+            startTime = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                phase[0] += 1
+                phase[1] += time.perf_counter() - startTime
+
+        setattr(obj, methodName, timedMethod)
+        self.wrappedMethods.append((obj, methodName))
+        return timedMethod
+
+    def detach(self) -> None:
+        """Restores every wrapped method, which removes all profiling overhead (NOTE: The data collected is kept)"""
+        for obj, methodName in self.wrappedMethods:
+            if methodName in obj.__dict__:
+                delattr(obj, methodName)
+        self.wrappedMethods = []
+        self.colony = None
+
+    # =============================================
+    # ============== SUMMARY METHODS ==============
+    # =============================================
+    def getPhaseSummary(self) -> list:
+        """Returns a row of (phase, calls, total seconds, mean microseconds per call) for every phase"""
+        phaseSummary = []
+        for phaseName, (numCalls, totalTime) in self.phaseData.items():
+            meanTime = totalTime / numCalls * 1e6 if numCalls > 0 else 0.0
+            phaseSummary.append({"phase": phaseName, "calls": numCalls, "totalSeconds": totalTime,
+                                 "meanMicroseconds": meanTime})
+        return phaseSummary
+
+    def getAggregateData(self, groupKey: str) -> list:
+        """Sums the counts of the recorded tours per episode (groupKey = "episode") or per ant (groupKey = "ant")"""
+        aggregateData = {}
+        for tour in self.tourData:
+            group = aggregateData.setdefault(tour[groupKey], {groupKey: tour[groupKey], "tours": 0, "steps": 0,
+                                                              "trips": 0, "backtracks": 0, "restarts": 0,
+                                                              "aborted": 0, "seconds": 0.0})
+            group["tours"] += 1
+            group["aborted"] += int(tour["isAborted"])
+            for count in ("steps", "trips", "backtracks", "restarts", "seconds"):
+                group[count] += tour[count]
+        return [aggregateData[group] for group in sorted(aggregateData.keys())]
+
+    def printPhaseSummary(self) -> None:
+        """Prints the calls and times of every phase"""
+        print("==================== PROFILE ====================")
+        for phase in self.getPhaseSummary():
+            print(phase["phase"] + ": calls = " + str(phase["calls"]) + ", total = " +
+                  str(round(phase["totalSeconds"], 4)) + "s, mean = " + str(round(phase["meanMicroseconds"], 2)) + "us")
+
+    # ============================================
+    # ============== EXPORT METHODS ==============
+    # ============================================
+    def exportJSON(self, filePath: str) -> None:
+        """Writes the phases, tours and their per episode/ant aggregates to a JSON file"""
+        profile = {"phases": self.getPhaseSummary(), "episodes": self.getAggregateData("episode"),
+                   "ants": self.getAggregateData("ant"), "tours": self.tourData}
+        with open(filePath, "w") as jsonFile:
+            json.dump(profile, jsonFile, indent=2, default=float)
+
+    def exportCSV(self, fileName: str) -> None:
+        """Writes the phases to <fileName>_phases.csv and the tours to <fileName>_tours.csv"""
+        tables = [("_phases.csv", self.getPhaseSummary(), ["phase", "calls", "totalSeconds", "meanMicroseconds"]),
+                  ("_tours.csv", self.tourData, ["episode", "ant", "steps", "trips", "backtracks", "restarts",
+                                                 "isAborted", "cost", "seconds"])]
+        for fileSuffix, rows, header in tables:
+            with open(fileName + fileSuffix, "w", newline="") as csvFile:
+                writer = csv.DictWriter(csvFile, fieldnames=header)
+                writer.writeheader()
+                writer.writerows(rows)
@@ -0,0 +1,50 @@
+import numpy as np
+from numpy import ndarray
+
+from src.Network.FlowNetwork import FlowNetwork
+from src.Network.Solution import Solution
+
+
+class TourRecord:
+    """Class that stores an ant's tour compactly as its cost and the sparse flows on arc numbers that carry flow"""
+
+    def __init__(self, trueCost: float, arcIndices: ndarray, arcFlows: ndarray, isDiscarded=False, numSteps=0):
+        """Constructor of a Tour Record instance"""
+        self.trueCost = trueCost  # NOTE: The cost bound the tour was abandoned at if it is discarded
+        self.isDiscarded = isDiscarded  # True if the ant abandoned the tour as it could not beat the incumbent
+        self.arcIndices = arcIndices  # Arc numbers (see FlowNetwork.buildAdjacencyArrays) with positive flow
+        self.arcFlows = arcFlows  # Flow assigned on each of the arc numbers above
+        self.numSteps = numSteps  # Number of time steps the ant took to build the tour (NOTE: 0 if not built by an ant)
+
+    def getDenseFlows(self, network: FlowNetwork) -> ndarray:
+        """Returns the flow on every arc number of the network"""
+        denseFlows = np.zeros(network.numAdjacencyArcs)
+        denseFlows[self.arcIndices] = self.arcFlows
+        return denseFlows
+
+    def writeSolution(self, network: FlowNetwork, minTargetFlow: float) -> Solution:
+        """Writes the tour to a Solution instance for visualization/saving"""
+        denseFlows = self.getDenseFlows(network)
+        sourceFlows = [int(flow) for flow in denseFlows[network.sourceArcsOffset:network.returnArcsOffset]]
+        sinkFlows = [int(flow) for flow in denseFlows[network.sinkArcsOffset:network.numAdjacencyArcs]]
+        arcFlows = {}
+        arcsOpened = {}
+        for edgeIndex in range(network.numEdges):
+            for capIndex in range(network.numArcCaps):
+                arcFlow = denseFlows[edgeIndex * network.numArcCaps + capIndex]
+                arcFlows[(edgeIndex, capIndex)] = int(arcFlow)
+                arcsOpened[(edgeIndex, capIndex)] = 1 if arcFlow > 0 else 0
+        solution = Solution(network, minTargetFlow, self.trueCost, self.trueCost, sourceFlows, sinkFlows, arcFlows,
+                            arcsOpened, "Ant", False, network.isSourceSinkCapacitated, network.isSourceSinkCharged)
+        return solution
+
+    @staticmethod
+    def fromSolution(network: FlowNetwork, solution: Solution):
+        """Builds a Tour Record from any Solution instance (e.g. one written by the MILP or relaxed LP solvers)"""
+        denseFlows = np.zeros(network.numAdjacencyArcs)
+        for (edgeIndex, capIndex), arcFlow in solution.arcFlows.items():
+            denseFlows[edgeIndex * network.numArcCaps + capIndex] = arcFlow
+        denseFlows[network.sourceArcsOffset:network.returnArcsOffset] = solution.sourceFlows
+        denseFlows[network.sinkArcsOffset:network.numAdjacencyArcs] = solution.sinkFlows
+        arcIndices = np.flatnonzero(denseFlows > 0.0)
+        return TourRecord(solution.trueCost, arcIndices, denseFlows[arcIndices])
@@ -0,0 +1,158 @@
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+from src.ACO.Colony import Colony
+from src.Network.FlowNetwork import FlowNetwork
+
+
+class BenchmarkExperiment:
+    """Class that defines a Benchmark Experiment object, used for timing the ACO and the mathematical programming
+    solvers over a fixed set of networks and seeds, and for flagging regressions against a stored baseline"""
+
+    # =========================================
+    # ============== CONSTRUCTOR ==============
+    # =========================================
+    def __init__(self, networkList: list, numAnts: int, numEpisodes: int, seeds=(0, 1, 2), solvers=("aco",),
+                 colonyOptions=None, isMeasuringMemory=True):
+        """Constructor of a Benchmark Experiment instance"""
+        # Input Attributes
+        self.networkList = networkList  # Network names following "<nodes>-<parallel edges>-<sources/sinks>[-<version>]"
+        self.numAnts = numAnts
+        self.numEpisodes = numEpisodes
+        self.seeds = list(seeds)  # Seeds of the colony's trials on every network (NOTE: The solvers run once)
+        self.solvers = list(solvers)  # Any of "aco", "milp" (CPLEX) and "lp" (PDLP relaxation)
+        if colonyOptions is None:
+            colonyOptions = {}  # Keyword arguments passed to the constructor of each colony (e.g. engine)
+        self.colonyOptions = colonyOptions
+        self.isMeasuringMemory = isMeasuringMemory  # Repeats each colony run once under tracemalloc to find its peak memory (NOTE: Not the solvers)
+
+        # Benchmark Results
+        self.results = []  # Stores a dictionary of the measurements of every run
+        now = datetime.now()
+        uniqueID = now.strftime("%d_%m_%Y_%H_%M")
+        self.fileName = "Benchmark_" + uniqueID
+
+    def runExperiment(self) -> list:
+        """Runs every solver over every network, and every seed for the colony, and writes the results to JSON"""
+        for networkName in self.networkList:
+            print("Benchmarking " + networkName + "...")
+            network = FlowNetwork()
+            network = network.loadNetwork(networkName + ".p")
+            minTargetFlow = self.getMinTargetFlow(networkName)
+            if "aco" in self.solvers and networkName == self.networkList[0]:
+                # NOTE: An untimed warm-up run keeps one-off costs (e.g. compiling the Numba engine) out of the timings
+                Colony(network, minTargetFlow, 1, 1, seed=0, **self.colonyOptions).solveNetwork(drawing=False)
+            for solver in self.solvers:
+                runSeeds = self.seeds if solver == "aco" else [None]
+                for seed in runSeeds:
+                    result = self.runSolver(solver, network, minTargetFlow, seed)
+                    result["network"] = networkName
+                    self.results.append(result)
+                    print(solver + " (seed = " + str(seed) + "): cost = " + str(round(result["cost"], 1)) +
+                          ", time = " + str(round(result["wallTime"], 3)) + "s")
+        self.writeResults()
+        print("\nBENCHMARK EXPERIMENT COMPLETE!")
+        return self.results
+
+    @staticmethod
+    def getMinTargetFlow(networkName: str) -> float:
+        """Returns the target flow used for the network, which is 100 per source/sink as in the results experiments"""
+        return int(networkName.split("-")[2]) * 100
+
+    # ============================================
+    # ============== SOLVER METHODS ==============
+    # ============================================
+    def runSolver(self, solver: str, network: FlowNetwork, minTargetFlow: float, seed) -> dict:
+        """Times one run of the solver and, if measuring memory, finds the colony's peak memory in a second traced run"""
+        startTime = time.perf_counter()
+        result = self.solveOnce(solver, network, minTargetFlow, seed)
+        result["wallTime"] = time.perf_counter() - startTime
+        result["toursPerSecond"] = result["numTours"] / result["wallTime"] if result["numTours"] > 0 else None
+        result["stepsPerSecond"] = result["numSteps"] / result["wallTime"] if result["numSteps"] > 0 else None
+        result["peakMemoryMB"] = None
+        # NOTE: Only memory allocated through Python (incl. NumPy) is traced, so the peak of the solvers' C libraries is
+        # left as None rather than solving them a second time for a meaningless measurement
+        if self.isMeasuringMemory is True and solver == "aco":
+            # NOTE: Tracing slows the run down, so the traced run is kept apart from the timed one
+            tracemalloc.start()
+            self.solveOnce(solver, network, minTargetFlow, seed)
+            result["peakMemoryMB"] = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+        result["solver"] = solver
+        result["seed"] = seed
+        result["minTargetFlow"] = minTargetFlow
+        return result
+
+    def solveOnce(self, solver: str, network: FlowNetwork, minTargetFlow: float, seed) -> dict:
+        """Solves the network with the solver and returns its cost and the number of tours and steps it took"""
+        if solver == "aco":
+            colony = Colony(network, minTargetFlow, self.numAnts, self.numEpisodes, seed=seed, **self.colonyOptions)
+            colony.solveNetwork(drawing=False)
+            return {"cost": float(colony.bestKnownCost), "numTours": self.numAnts * colony.numEpisodesSolved,
+                    "numSteps": int(sum(colony.stepsData))}
+        elif solver == "milp":
+            from src.Solvers.MILPsolverCPLEX import MILPsolverCPLEX  # NOTE: Imported here, as CPLEX is only needed for this solver
+            exactSolver = MILPsolverCPLEX(network, minTargetFlow, isOneArcPerEdge=False)
+            exactSolver.buildModel()
+            exactSolver.solveModel()
+            return {"cost": float(exactSolver.model.solution.get_objective_value()), "numTours": 0, "numSteps": 0}
+        elif solver == "lp":
+            from src.Solvers.RelaxedLPSolverPDLP import RelaxedLPSolverPDLP  # NOTE: Imported here, as OR-Tools is only needed for this solver
+            relaxedSolver = RelaxedLPSolverPDLP(network, minTargetFlow)
+            relaxedSolver.updateObjectiveFunction(np.full((network.numEdges, network.numArcCaps), 1.0))
+            relaxedSolver.solveModel()
+            relaxedSolver.writeSolution()
+            return {"cost": float(relaxedSolver.trueCost), "numTours": 0, "numSteps": 0}
+        raise ValueError("Unknown solver " + str(solver) + " (NOTE: Use \"aco\", \"milp\" or \"lp\")")
+
+    # =============================================
+    # ============== RESULTS METHODS ==============
+    # =============================================
+    def writeResults(self) -> None:
+        """Writes the results, along with the settings and platform they were measured on, to a JSON file"""
+        jsonName = self.fileName + ".json"
+        print("Writing benchmark results to: " + jsonName)
+        benchmark = {"timestamp": datetime.now().strftime("%d/%m/%Y %H:%M:%S"), "numAnts": self.numAnts,
+                     "numEpisodes": self.numEpisodes, "colonyOptions": self.colonyOptions,
+                     "python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(),
+                     "results": self.results}
+        with open(jsonName, "w") as jsonFile:
+            json.dump(benchmark, jsonFile, indent=2)
+
+    def compareToBaseline(self, baselineFile: str, timeTolerance=0.2, memoryTolerance=0.2,
+                          costTolerance=0.0) -> list:
+        """Flags every run that is slower, uses more memory or finds a worse cost than the same run in the baseline,
+        beyond the relative tolerances, and returns the regressions"""
+        with open(baselineFile, "r") as jsonFile:
+            baselineResults = json.load(jsonFile)["results"]
+        baseline = {(result["network"], result["solver"], result["seed"]): result for result in baselineResults}
+        regressions = []
+        for result in self.results:
+            baselineResult = baseline.get((result["network"], result["solver"], result["seed"]))
+            if baselineResult is None:
+                continue  # NOTE: Runs missing from the baseline are not compared
+            for measure, tolerance in (("wallTime", timeTolerance), ("peakMemoryMB", memoryTolerance),
+                                       ("cost", costTolerance)):
+                if result[measure] is None or baselineResult[measure] is None:
+                    continue
+                if result[measure] > baselineResult[measure] * (1 + tolerance):
+                    regressions.append({"network": result["network"], "solver": result["solver"],
+                                        "seed": result["seed"], "measure": measure,
+                                        "baseline": baselineResult[measure], "current": result[measure]})
+        self.printRegressions(regressions)
+        return regressions
+
+    @staticmethod
+    def printRegressions(regressions: list) -> None:
+        """Prints every regression found against the baseline"""
+        if len(regressions) == 0:
+            print("No regressions against the baseline!")
+        for regression in regressions:
+            print("REGRESSION: " + regression["network"] + " " + regression["solver"] + " (seed = " +
+                  str(regression["seed"]) + "): " + regression["measure"] + " " + str(round(regression["baseline"], 4)) +
+                  " -> " + str(round(regression["current"], 4)))
@@ -15,12 +15,13 @@ class ResultsExperiment:
     # =========================================
     # ============== CONSTRUCTOR ==============
     # =========================================
-    def __init__(self, networkList: list, numAnts: int, numEpisodes: int):
+    def __init__(self, networkList: list, numAnts: int, numEpisodes: int, seed=None):
         """Constructor of a Tuning Experiment instance"""
         # Input Attributes
         self.networkList = networkList
         self.numAnts = numAnts
         self.numEpisodes = numEpisodes
+        self.seed = seed  # Seed that every ACO trial's seed is spawned from (NOTE: None is irreproducible)
 
         # Experimental Results
         self.outputBlock = []
@@ -66,8 +67,9 @@ class ResultsExperiment:
             print("Relaxed solution found...")
             # Run ACO trials
             acoTrials = []
+            trialSeeds = [int(seed.generate_state(1)[0]) for seed in np.random.SeedSequence(self.seed).spawn(10)]
             for trial in range(10):
-                aco = Colony(network, minTargetFlow, self.numAnts, self.numEpisodes)
+                aco = Colony(network, minTargetFlow, self.numAnts, self.numEpisodes, seed=trialSeeds[trial])
                 aco.solveNetwork(drawing=False)
                 outputRow.append(aco.bestKnownCost)
                 acoTrials.append(aco.bestKnownCost)
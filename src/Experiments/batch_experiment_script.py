@@ -8,21 +8,22 @@ numGraphs = 50
 nodeSizeRange = [25, 400]
 srcSinkSet = [1, 5, 10]
 possibleArcCaps = [100]
+seed = None  # Set to an integer to regenerate and resolve the identical batch of networks
 networkList = []
+batchRandom = random.Random(seed)  # Draws the size of every network and the seed it is built from
 
 # Automatically generate n input networks
 for n in range(numGraphs):
-    random.seed()
     # Uniformly sample number of nodes
-    numNodes = random.randint(nodeSizeRange[0], nodeSizeRange[1])
-    numSrcSinks = random.sample(srcSinkSet, 1)[0]
+    numNodes = batchRandom.randint(nodeSizeRange[0], nodeSizeRange[1])
+    numSrcSinks = batchRandom.choice(srcSinkSet)
     # Keep sampling until there is enough nodes to support the sources and sinks
     while numSrcSinks > math.floor(numNodes / 2):
-        numNodes = random.randint(nodeSizeRange[0], nodeSizeRange[1])
-        numSrcSinks = random.randint(srcSinkSet[0], srcSinkSet[1])
+        numNodes = batchRandom.randint(nodeSizeRange[0], nodeSizeRange[1])
+        numSrcSinks = batchRandom.choice(srcSinkSet)
     # Build and save the network
     networkName = str(numNodes) + "-" + str(len(possibleArcCaps)) + "-" + str(numSrcSinks) + "-" + str(n)
-    graphMaker = GraphMaker(networkName, numNodes, numSrcSinks, numSrcSinks)
+    graphMaker = GraphMaker(networkName, numNodes, numSrcSinks, numSrcSinks, seed=batchRandom.getrandbits(64))
     graphMaker.setCostDeterminingHyperparameters(possibleArcCaps=possibleArcCaps)
     graphMaker.setSourceSinkGeneralizations(True, True)
     generatedNetwork = graphMaker.generateNetwork()
@@ -32,5 +33,5 @@ for n in range(numGraphs):
 # Solve all networks
 numAnts = 50
 numEpisodes = 15
-experiment = ResultsExperiment(networkList, numAnts, numEpisodes)
+experiment = ResultsExperiment(networkList, numAnts, numEpisodes, seed=seed)
 experiment.runExperiment()
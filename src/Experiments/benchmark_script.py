@@ -0,0 +1,34 @@
+from src.Experiments.BenchmarkExperiment import BenchmarkExperiment
+
+numAnts = 50
+numEpisodes = 15
+seeds = [0, 1, 2]
+solvers = ["aco", "milp", "lp"]
+colonyOptions = {"engine": "numba"}
+baselineFile = None  # Set to a previous benchmark's JSON file (e.g. "Benchmark_01_01_2023_12_00.json") to compare
+networkList = [
+    "25-1-1",
+    "25-1-5",
+    "25-1-10",
+    "50-1-1",
+    "50-1-5",
+    "50-1-10",
+    "100-1-1",
+    "100-1-5",
+    "100-1-10",
+    "200-1-1",
+    "200-1-5",
+    "200-1-10",
+    "300-1-1",
+    "300-1-5",
+    "300-1-10",
+    "400-1-1",
+    "400-1-5",
+    "400-1-10",
+]
+
+experiment = BenchmarkExperiment(networkList, numAnts, numEpisodes, seeds=seeds, solvers=solvers,
+                                 colonyOptions=colonyOptions)
+experiment.runExperiment()
+if baselineFile is not None:
+    experiment.compareToBaseline(baselineFile)
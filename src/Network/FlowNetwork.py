@@ -1,5 +1,7 @@
+import json
 import os
 import pickle
+import sys
 
 import numpy as np
 from matplotlib import pyplot as plt
@@ -13,6 +15,8 @@ from src.Network.Node import Node
 class FlowNetwork:
     """Class that defines a Network object with multi-source/multi-sink and parallel edges, called arcs"""
 
+    networkFormatVersion = 1  # Version of the npz network format written by saveNetwork
+
     # =========================================
     # ============== CONSTRUCTOR ==============
     # =========================================
@@ -21,7 +25,7 @@ class FlowNetwork:
         self.name = ""
         # Node Attributes
         self.numTotalNodes = 0
-        self.nodesDict = {}
+        self.storedNodesDict = {}  # NOTE: None until first used if the network was loaded from an npz (see nodesDict)
         self.points = None
         self.numSources = 0
         self.sourcesArray = None
@@ -32,12 +36,12 @@ class FlowNetwork:
         # Edge/Arc Attributes
         self.numEdges = 0
         self.edgesArray = None
-        self.edgesDict = {}
+        self.storedEdgesDict = {}  # NOTE: None until first used if the network was loaded from an npz (see edgesDict)
         self.distancesArray = None
         self.numArcCaps = 0
         self.possibleArcCapsArray = None
         self.numArcs = 0
-        self.arcsDict = {}
+        self.storedArcsDict = {}  # NOTE: None until first used if the network was loaded from an npz (see arcsDict)
         self.arcsMatrix = None
         # Capacitated/Charged Source/Sink Generalization
         self.isSourceSinkCapacitated = False
@@ -47,6 +51,36 @@ class FlowNetwork:
         self.isSourceSinkCharged = False
         self.sourceVariableCostsArray = None
         self.sinkVariableCostsArray = None
+        # Adjacency Arrays (i.e. compressed-sparse-row view of every arc an ant can traverse, indexed by arc number)
+        # NOTE: Arc numbers are laid out as [edge arcs | supersource -> source | source -> supersource | sink -> supersink]
+        # NOTE: These struct-of-arrays are the network's core, which the arc getters, the solvers and the ACO index directly
+        self.numAdjacencyArcs = 0
+        self.sourceArcsOffset = 0
+        self.returnArcsOffset = 0
+        self.sinkArcsOffset = 0
+        self.adjacencyOffsetsArray = None  # Row r holds the arcs leaving node r (NOTE: Row numTotalNodes is the supersource)
+        self.adjacencyArcsArray = None
+        self.adjacencyDegreesArray = None  # Number of arcs in each row of the adjacency
+        self.arcToRowArray = None  # Adjacency row of each arc number (i.e. its tail, where the supersource is numTotalNodes)
+        self.arcToSlotArray = None  # Position of each arc number in the adjacency arcs array
+        self.incomingOffsetsArray = None  # Row n holds the edge arcs entering node n (i.e. the reverse adjacency)
+        self.incomingArcsArray = None
+        self.outgoingEdgeOffsetsArray = None  # Row n holds the indices of the edges leaving node n
+        self.outgoingEdgesArray = None
+        self.incomingEdgeOffsetsArray = None  # Row n holds the indices of the edges entering node n
+        self.incomingEdgesArray = None
+        self.capToCapIndexDict = None  # Index of each possible arc capacity in the possible arc capacities array
+        self.arcToTailArray = None
+        self.arcToHeadArray = None
+        self.arcToCapacityArray = None
+        self.nodeToSourceIndexArray = None
+        self.nodeToSinkIndexArray = None
+        self.arcKeysList = None  # Tuple key (fromNode, toNode, cap) of each arc number
+        self.arcToFixedCostArray = None  # Fixed cost of opening each arc number (NOTE: Zero for the supersource/sink arcs)
+        self.arcToVariableCostArray = None  # Variable cost per unit of flow on each arc number (NOTE: Zero for source -> supersource)
+        self.edgeToReverseEdgeArray = None  # Edge index of the opposing edge (i.e. (j, i) for edge (i, j))
+        self.capacityTemplateArray = None  # Immutable available capacity of every arc number at the start of a tour
+        self.flowTemplateArray = None  # Immutable assigned flow of every arc number at the start of a tour (i.e. zeros)
 
     # ===================================================
     # ============== VISUALIZATION METHODS ==============
@@ -78,27 +112,84 @@ class FlowNetwork:
     # =================================================
     # ============== DATA IN/OUT METHODS ==============
     # =================================================
-    def saveNetwork(self) -> None:
-        """Saves the network instance to disc via a pickle dump"""
+    def saveNetwork(self, fileName=None) -> None:
+        """Saves the network instance to disc as a compressed npz of its arrays, named after the network unless a file
+        name is given (NOTE: The node/arc objects are not saved, as they are rebuilt from the arrays on first use)"""
         # Path management
         currDir = os.getcwd()
-        networkFile = self.name + ".p"
+        if fileName is None:
+            fileName = self.name
+        networkFile = fileName + ".npz"
         catPath = os.path.join(currDir, "../networkInstances", networkFile)
         print("Saving " + networkFile + " to: " + catPath)
-        # Pickle dump
-        pickle.dump(self, open(catPath, "wb"))
+        # Compressed NumPy dump (NOTE: The scalars are stored as a JSON string, so no pickling is needed to load)
+        metadata = {"formatVersion": self.networkFormatVersion, "name": self.name,
+                    "isSourceSinkCapacitated": self.isSourceSinkCapacitated,
+                    "isSourceSinkCharged": self.isSourceSinkCharged}
+        networkArrays = {}
+        for arrayName in ("points", "sourcesArray", "sinksArray", "interNodesArray", "edgesArray", "distancesArray",
+                          "possibleArcCapsArray", "arcsMatrix", "sourceCapsArray", "sinkCapsArray",
+                          "sourceVariableCostsArray", "sinkVariableCostsArray"):
+            if getattr(self, arrayName) is not None:
+                networkArrays[arrayName] = getattr(self, arrayName)
+        np.savez_compressed(catPath, metadata=np.array(json.dumps(metadata)), **networkArrays)
 
     @staticmethod
-    def loadNetwork(networkFile: str) -> None:
-        """Loads a network instance via a pickle load"""
+    def loadNetwork(networkFile: str):
+        """Loads a network instance from an npz, or from a legacy pickle (NOTE: Loading "<name>.p" reads "<name>.npz"
+        instead if it exists)"""
         # Path management
         currDir = os.getcwd()
         catPath = os.path.join(currDir, "../networkInstances", networkFile)
+        if networkFile.endswith(".p") and os.path.exists(catPath[:-2] + ".npz"):
+            networkFile = networkFile[:-2] + ".npz"
+            catPath = catPath[:-2] + ".npz"
         print("Loading " + networkFile + " from: " + catPath)
-        # Pickle load
-        flowNetwork = pickle.load(open(catPath, "rb"))
+        if networkFile.endswith(".npz"):
+            flowNetwork = FlowNetwork.readNetworkArrays(catPath)
+        else:
+            # Legacy pickle load
+            flowNetwork = pickle.load(open(catPath, "rb"))
+        return flowNetwork
+
+    @staticmethod
+    def readNetworkArrays(catPath: str):
+        """Builds a network instance from the arrays of an npz, leaving its node/arc objects to be built on first use"""
+        with np.load(catPath) as networkFileData:
+            networkData = {arrayName: networkFileData[arrayName] for arrayName in networkFileData.files}
+        metadata = json.loads(str(networkData.pop("metadata")))
+        if metadata["formatVersion"] > FlowNetwork.networkFormatVersion:
+            raise ValueError(catPath + " uses network format version " + str(metadata["formatVersion"]) +
+                             ", which is newer than the supported version " + str(FlowNetwork.networkFormatVersion))
+        flowNetwork = FlowNetwork()
+        flowNetwork.name = metadata["name"]
+        flowNetwork.isSourceSinkCapacitated = metadata["isSourceSinkCapacitated"]
+        flowNetwork.isSourceSinkCharged = metadata["isSourceSinkCharged"]
+        for arrayName, array in networkData.items():
+            setattr(flowNetwork, arrayName, array)
+        flowNetwork.numTotalNodes = len(flowNetwork.points)
+        flowNetwork.numSources = len(flowNetwork.sourcesArray)
+        flowNetwork.numSinks = len(flowNetwork.sinksArray)
+        flowNetwork.numInterNodes = len(flowNetwork.interNodesArray)
+        flowNetwork.numEdges = len(flowNetwork.edgesArray)
+        flowNetwork.numArcCaps = len(flowNetwork.possibleArcCapsArray)
+        flowNetwork.numArcs = len(flowNetwork.arcsMatrix)
+        flowNetwork.storedNodesDict = None
+        flowNetwork.storedEdgesDict = None
+        flowNetwork.storedArcsDict = None
+        flowNetwork.buildAdjacencyArrays()
         return flowNetwork
 
+    def __setstate__(self, state: dict) -> None:
+        """Restores a pickled network, moving the dictionaries of legacy pickles to where the lazy views store them and
+        building the adjacency arrays of pickles saved without them"""
+        for dictName in ("nodesDict", "edgesDict", "arcsDict"):
+            if dictName in state:
+                state["stored" + dictName[0].upper() + dictName[1:]] = state.pop(dictName)
+        self.__dict__.update(state)
+        if getattr(self, "arcToCapacityArray", None) is None and getattr(self, "edgesArray", None) is not None:
+            self.buildAdjacencyArrays()  # NOTE: Networks pickled before their edges were built are left as is
+
     # =====================================================
     # ============== NETWORK BUILDER METHODS ==============
     # =====================================================
@@ -116,6 +207,148 @@ class FlowNetwork:
         thisArc = Arc(numID, (arcID[0], arcID[1]), arcID[2], distance, FC, VC)
         self.arcsDict[arcID] = thisArc
 
+    # ===============================================
+    # ============== LAZY VIEW METHODS ==============
+    # ===============================================
+    @property
+    def nodesDict(self) -> dict:
+        """Returns the dictionary of node objects, building it from the node arrays on first use"""
+        if self.storedNodesDict is None:
+            nodeTypes = np.full(self.numTotalNodes, 2)
+            nodeTypes[self.sourcesArray] = 0
+            nodeTypes[self.sinksArray] = 1
+            self.storedNodesDict = {}
+            for nodeID, (xPos, yPos) in enumerate(self.points.tolist()):
+                thisNode = Node(nodeID, xPos, yPos)
+                thisNode.nodeType = int(nodeTypes[nodeID])
+                self.storedNodesDict[nodeID] = thisNode
+            for edge in self.edgesArray.tolist():
+                thisEdge = (edge[0], edge[1])
+                self.storedNodesDict[edge[0]].addOutgoingEdge(thisEdge)
+                self.storedNodesDict[edge[1]].addIncomingEdge(thisEdge)
+        return self.storedNodesDict
+
+    @nodesDict.setter
+    def nodesDict(self, nodesDict: dict) -> None:
+        """Replaces the dictionary of node objects"""
+        self.storedNodesDict = nodesDict
+
+    @property
+    def edgesDict(self) -> dict:
+        """Returns the dictionary of edge indices, building it from the edges array on first use"""
+        if self.storedEdgesDict is None:
+            self.storedEdgesDict = {(edge[0], edge[1]): index for index, edge in enumerate(self.edgesArray.tolist())}
+        return self.storedEdgesDict
+
+    @edgesDict.setter
+    def edgesDict(self, edgesDict: dict) -> None:
+        """Replaces the dictionary of edge indices"""
+        self.storedEdgesDict = edgesDict
+
+    @property
+    def arcsDict(self) -> dict:
+        """Returns the dictionary of arc objects, building it from the arcs matrix on first use"""
+        if self.storedArcsDict is None:
+            self.storedArcsDict = {}
+            for numID, fromNode, toNode, cap, distance, FC, VC in self.arcsMatrix.tolist():
+                arcID = (int(fromNode), int(toNode), int(cap))
+                self.storedArcsDict[arcID] = Arc(int(numID), (arcID[0], arcID[1]), arcID[2], distance, FC, VC)
+        return self.storedArcsDict
+
+    @arcsDict.setter
+    def arcsDict(self, arcsDict: dict) -> None:
+        """Replaces the dictionary of arc objects"""
+        self.storedArcsDict = arcsDict
+
+    # =====================================================
+    # ============== ADJACENCY ARRAY METHODS ==============
+    # =====================================================
+    def buildAdjacencyArrays(self) -> None:
+        """Builds the compressed-sparse-row adjacency over all arcs, including the supersource/sink arcs"""
+        # Compute the offsets of the supersource/sink arcs, which are appended after the edge arcs
+        self.sourceArcsOffset = self.numArcs
+        self.returnArcsOffset = self.sourceArcsOffset + self.numSources
+        self.sinkArcsOffset = self.returnArcsOffset + self.numSources
+        self.numAdjacencyArcs = self.sinkArcsOffset + self.numSinks
+        # Edge arcs are numbered edgeIndex * numArcCaps + capIndex, matching the row order of the arcs matrix
+        edgeTails = np.repeat(self.edgesArray[:, 0], self.numArcCaps)
+        edgeHeads = np.repeat(self.edgesArray[:, 1], self.numArcCaps)
+        edgeCaps = np.tile(self.possibleArcCapsArray, self.numEdges)
+        # NOTE: -1 represents the supersource and -2 represents the supersink, and source -> supersource is uncapacitated
+        self.arcToTailArray = np.concatenate((edgeTails, np.full(self.numSources, -1), self.sourcesArray,
+                                              self.sinksArray)).astype(np.int64)
+        self.arcToHeadArray = np.concatenate((edgeHeads, self.sourcesArray, np.full(self.numSources, -1),
+                                              np.full(self.numSinks, -2))).astype(np.int64)
+        # NOTE: The sources/sinks of a network that is not source/sink capacitated are uncapacitated, like the solvers treat them
+        sourceCaps, sinkCaps = self.sourceCapsArray, self.sinkCapsArray
+        if self.isSourceSinkCapacitated is False:
+            sourceCaps, sinkCaps = np.full(self.numSources, sys.maxsize), np.full(self.numSinks, sys.maxsize)
+        self.arcToCapacityArray = np.concatenate((edgeCaps, sourceCaps, np.full(self.numSources, sys.maxsize),
+                                                  sinkCaps)).astype(np.int64)
+        # Build the rows of the adjacency, where arcs leaving the supersource are stored in the last row
+        arcRows = np.where(self.arcToTailArray >= 0, self.arcToTailArray, self.numTotalNodes)
+        self.adjacencyDegreesArray = np.bincount(arcRows, minlength=self.numTotalNodes + 1).astype(np.int64)
+        self.adjacencyOffsetsArray = np.concatenate(([0], np.cumsum(self.adjacencyDegreesArray))).astype(np.int64)
+        self.adjacencyArcsArray = np.argsort(arcRows, kind="stable").astype(np.int64)
+        self.arcToRowArray = arcRows.astype(np.int64)
+        self.arcToSlotArray = np.empty(self.numAdjacencyArcs, dtype=np.int64)
+        self.arcToSlotArray[self.adjacencyArcsArray] = np.arange(self.numAdjacencyArcs)
+        # Build the reverse adjacency of the edge arcs, which is used to search backwards from the sinks
+        incomingDegrees = np.bincount(edgeHeads, minlength=self.numTotalNodes)
+        self.incomingOffsetsArray = np.concatenate(([0], np.cumsum(incomingDegrees))).astype(np.int64)
+        self.incomingArcsArray = np.argsort(edgeHeads, kind="stable").astype(np.int64)
+        # Build the outgoing/incoming edge indices of every node (NOTE: In edge order, as the node objects list them)
+        outgoingDegrees = np.bincount(self.edgesArray[:, 0], minlength=self.numTotalNodes)
+        self.outgoingEdgeOffsetsArray = np.concatenate(([0], np.cumsum(outgoingDegrees))).astype(np.int64)
+        self.outgoingEdgesArray = np.argsort(self.edgesArray[:, 0], kind="stable").astype(np.int64)
+        incomingEdgeDegrees = np.bincount(self.edgesArray[:, 1], minlength=self.numTotalNodes)
+        self.incomingEdgeOffsetsArray = np.concatenate(([0], np.cumsum(incomingEdgeDegrees))).astype(np.int64)
+        self.incomingEdgesArray = np.argsort(self.edgesArray[:, 1], kind="stable").astype(np.int64)
+        self.capToCapIndexDict = {cap: capIndex for capIndex, cap in enumerate(self.possibleArcCapsArray.tolist())}
+        # Map node IDs to their index in the sources/sinks arrays (NOTE: -1 if the node is not a source/sink)
+        self.nodeToSourceIndexArray = np.full(self.numTotalNodes, -1, dtype=np.int64)
+        self.nodeToSourceIndexArray[self.sourcesArray] = np.arange(self.numSources)
+        self.nodeToSinkIndexArray = np.full(self.numTotalNodes, -1, dtype=np.int64)
+        self.nodeToSinkIndexArray[self.sinksArray] = np.arange(self.numSinks)
+        # Build the tuple keys used by the dictionary based data structures (NOTE: Source -> supersource has cap -1)
+        arcKeyCaps = self.arcToCapacityArray.copy()
+        arcKeyCaps[self.returnArcsOffset:self.sinkArcsOffset] = -1
+        self.arcKeysList = list(zip(self.arcToTailArray.tolist(), self.arcToHeadArray.tolist(), arcKeyCaps.tolist()))
+        # Gather the cost vectors over arc numbers from the arcs matrix and the source/sink variable costs
+        edgeArcRows = self.arcsMatrix[:, 0].astype(np.int64)
+        if not (np.array_equal(self.arcsMatrix[:, 1], edgeTails) and np.array_equal(self.arcsMatrix[:, 2], edgeHeads)
+                and np.array_equal(self.arcsMatrix[:, 3], edgeCaps) and np.array_equal(edgeArcRows, np.arange(self.numArcs))):
+            # NOTE: Only needed if the rows of the arcs matrix are not in edge/cap order (GraphMaker always writes them so)
+            edgeArcRows = np.array([self.arcsDict[arcKey].numID for arcKey in self.arcKeysList[:self.numArcs]],
+                                   dtype=np.int64)
+        self.arcToFixedCostArray = np.zeros(self.numAdjacencyArcs)
+        self.arcToFixedCostArray[:self.numArcs] = self.arcsMatrix[edgeArcRows, 5]
+        # NOTE: The sources/sinks of a network that is not source/sink charged are free, like the solvers treat them
+        sourceVariableCosts, sinkVariableCosts = self.sourceVariableCostsArray, self.sinkVariableCostsArray
+        if self.isSourceSinkCharged is False:
+            sourceVariableCosts, sinkVariableCosts = np.zeros(self.numSources), np.zeros(self.numSinks)
+        self.arcToVariableCostArray = np.concatenate((self.arcsMatrix[edgeArcRows, 6], sourceVariableCosts,
+                                                      np.zeros(self.numSources), sinkVariableCosts))
+        # Find the opposing edge of each edge by searching the sorted (fromNode, toNode) keys for (toNode, fromNode)
+        edgeKeys = self.edgesArray[:, 0].astype(np.int64) * self.numTotalNodes + self.edgesArray[:, 1]
+        sortedEdges = np.argsort(edgeKeys, kind="stable")
+        reverseKeys = self.edgesArray[:, 1].astype(np.int64) * self.numTotalNodes + self.edgesArray[:, 0]
+        self.edgeToReverseEdgeArray = sortedEdges[np.searchsorted(edgeKeys, reverseKeys, sorter=sortedEdges)].astype(np.int64)
+        # Cache the immutable templates that ants copy their tour state from when they reset
+        for adjacencyArray in (self.adjacencyArcsArray, self.adjacencyDegreesArray, self.arcToSlotArray,
+                               self.incomingArcsArray, self.outgoingEdgesArray, self.incomingEdgesArray,
+                               self.arcToFixedCostArray, self.arcToVariableCostArray):
+            adjacencyArray.setflags(write=False)
+        self.capacityTemplateArray = self.arcToCapacityArray.astype(float)
+        self.capacityTemplateArray.setflags(write=False)
+        self.flowTemplateArray = np.zeros(self.numAdjacencyArcs)
+        self.flowTemplateArray.setflags(write=False)
+
+    def getAdjacentArcs(self, nodeID: int) -> ndarray:
+        """Returns the arc numbers leaving the node (NOTE: -1 returns the arcs leaving the supersource)"""
+        row = nodeID if nodeID >= 0 else self.numTotalNodes
+        return self.adjacencyArcsArray[self.adjacencyOffsetsArray[row]:self.adjacencyOffsetsArray[row + 1]]
+
     # ===================================================================
     # ============== EDGE/ARC GETTER/SETTER/HELPER METHODS ==============
     # ===================================================================
@@ -143,42 +376,41 @@ class FlowNetwork:
         """Returns the arc object with the given ID"""
         return self.arcsDict[arcID]
 
+    def getArcNumber(self, arcID: tuple) -> int:
+        """Returns the arc number of the arc with the given ID (i.e. edgeIndex * numArcCaps + capIndex)"""
+        return self.edgesDict[(arcID[0], arcID[1])] * self.numArcCaps + self.capToCapIndexDict[arcID[2]]
+
+    def getArcNumberFromEdgeCapIndices(self, edgeIndex: int, capIndex: int) -> int:
+        """Returns the arc number from the edge index and the capacity index"""
+        return edgeIndex * self.numArcCaps + capIndex
+
     def getArcEdge(self, arcID: tuple) -> tuple:
         """Returns the edge that the arc spans"""
-        arc = self.arcsDict[arcID]
-        return arc.edgeID
+        return arcID[0], arcID[1]
 
     def getArcCapacity(self, arcID: tuple) -> int:
         """Returns the arc's capacity"""
-        arc = self.arcsDict[arcID]
-        return arc.capacity
+        return self.arcToCapacityArray[self.getArcNumber(arcID)]
 
     def getArcDistance(self, arcID: tuple) -> float:
         """Returns the arc's distance"""
-        arc = self.arcsDict[arcID]
-        return arc.distance
+        return self.distancesArray[self.edgesDict[(arcID[0], arcID[1])]]
 
     def getArcFixedCost(self, arcID: tuple) -> float:
         """Returns the arc's fixed cost"""
-        arc = self.arcsDict[arcID]
-        return arc.fixedCost
+        return self.arcToFixedCostArray[self.getArcNumber(arcID)]
 
     def getArcVariableCost(self, arcID: tuple) -> float:
         """Returns the arc's variable cost"""
-        arc = self.arcsDict[arcID]
-        return arc.variableCost
+        return self.arcToVariableCostArray[self.getArcNumber(arcID)]
 
     def getArcFixedCostFromEdgeCapIndices(self, edgeIndex: int, capIndex: int) -> float:
         """Gets the arc fixed cost from the edge index and the capacity index"""
-        arcFixedCost = self.arcsMatrix[self.arcsDict[(self.edgesArray[edgeIndex][0], self.edgesArray[edgeIndex][1],
-                                                      self.possibleArcCapsArray[capIndex])].numID][5]
-        return arcFixedCost
+        return self.arcToFixedCostArray[edgeIndex * self.numArcCaps + capIndex]
 
     def getArcVariableCostFromEdgeCapIndices(self, edgeIndex: int, capIndex: int) -> float:
         """Gets the arc variable cost from the edge index and the capacity index"""
-        arcVariableCost = self.arcsMatrix[self.arcsDict[(self.edgesArray[edgeIndex][0], self.edgesArray[edgeIndex][1],
-                                                         self.possibleArcCapsArray[capIndex])].numID][6]
-        return arcVariableCost
+        return self.arcToVariableCostArray[edgeIndex * self.numArcCaps + capIndex]
 
     # ===============================================================
     # ============== NODE GETTER/SETTER/HELPER METHODS ==============
@@ -193,8 +425,7 @@ class FlowNetwork:
 
     def getNodeCoordinates(self, nodeID: int) -> tuple:
         """Returns the (x,y) tuple position of the node"""
-        node = self.nodesDict[nodeID]
-        return node.xPos, node.yPos
+        return self.points[nodeID, 0], self.points[nodeID, 1]
 
     def getNodeType(self, nodeID: int) -> int:
         """Returns the type of the node (NOTE: nodeType = {0: source, 1: sink, 2: intermediate})"""
@@ -211,6 +442,14 @@ class FlowNetwork:
         node = self.nodesDict[nodeID]
         return node.outgoingEdges
 
+    def getNodeIncomingEdgeIndices(self, nodeID: int) -> ndarray:
+        """Returns the indices of the edges entering the node"""
+        return self.incomingEdgesArray[self.incomingEdgeOffsetsArray[nodeID]:self.incomingEdgeOffsetsArray[nodeID + 1]]
+
+    def getNodeOutgoingEdgeIndices(self, nodeID: int) -> ndarray:
+        """Returns the indices of the edges leaving the node"""
+        return self.outgoingEdgesArray[self.outgoingEdgeOffsetsArray[nodeID]:self.outgoingEdgeOffsetsArray[nodeID + 1]]
+
     def getNumSources(self) -> int:
         """Returns the number of sources in the network"""
         return self.numSources
@@ -11,8 +11,12 @@ from src.Network.FlowNetwork import FlowNetwork
 class GraphMaker:
     """Class that generates pseudorandom graphs from 2D embedded points and their Delaunay triangulation"""
 
-    def __init__(self, name: str, numNodes: int, numSources: int, numSinks: int):
+    def __init__(self, name: str, numNodes: int, numSources: int, numSinks: int, seed=None):
         """Constructor of a GraphGenerator instance"""
+        # Random Stream (NOTE: The same seed builds an identical network, while None draws fresh OS entropy)
+        self.seed = seed
+        self.random = random.Random(seed)  # Every pseudorandom draw of the network comes from this stream
+
         # Hyperparameters For Network Generation/Computing Pseudo-Random Costs
         self.embeddingSize = 100.0
         self.possibleArcCaps = [10, 50, 100]
@@ -44,6 +48,7 @@ class GraphMaker:
         self.setPossibleArcCapacities(self.possibleArcCaps)
         self.buildArcsDictAndMatrix()
         self.assignSourceSinkCapAndCharge()
+        self.newNetwork.buildAdjacencyArrays()
         return self.newNetwork
 
     def setCostDeterminingHyperparameters(self, embeddingSize=100.0, possibleArcCaps=(10, 50, 100),
@@ -70,11 +75,10 @@ class GraphMaker:
 
     def embedRandomPoints(self) -> None:
         """Randomly embeds n points in a 2D plane"""
-        random.seed()
         tempPoints = []
         for n in range(self.newNetwork.numTotalNodes):
-            xPos = random.random() * self.embeddingSize
-            yPos = random.random() * self.embeddingSize
+            xPos = self.random.random() * self.embeddingSize
+            yPos = self.random.random() * self.embeddingSize
             tempPoints.append((xPos, yPos))
             self.newNetwork.addNodeToDict(n, xPos, yPos)
         self.newNetwork.points = np.array(tempPoints)
@@ -82,9 +86,9 @@ class GraphMaker:
     def assignRandomSourceSinks(self) -> None:
         """Randomly assigns source and sink IDs to nodes"""
         tempNodes = set(range(self.newNetwork.numTotalNodes))
-        tempSrcSinks = set(random.sample(tempNodes, self.newNetwork.numSources + self.newNetwork.numSinks))
+        tempSrcSinks = set(self.random.sample(sorted(tempNodes), self.newNetwork.numSources + self.newNetwork.numSinks))
         tempInterNodes = tempNodes.symmetric_difference(tempSrcSinks)
-        tempSources = set(random.sample(tempSrcSinks, self.newNetwork.numSources))
+        tempSources = set(self.random.sample(sorted(tempSrcSinks), self.newNetwork.numSources))
         tempSinks = tempSrcSinks.symmetric_difference(tempSources)
         self.newNetwork.sourcesArray = np.array(list(tempSources))
         for source in self.newNetwork.sourcesArray:
@@ -169,7 +173,7 @@ class GraphMaker:
         """Calculates the fixed cost of the arc in a pseudorandom manner"""
         # TODO - Apply the pipeline cost function: c(f) = (m*cap + b) * edge_specific_penalty (which is based on distance)
         # Pseudorandom component proportional to the distance the edge spans
-        randomDistanceComponent = (self.distFixCostScale * distance * random.uniform(
+        randomDistanceComponent = (self.distFixCostScale * distance * self.random.uniform(
             self.fixCostRandomScalar[0], self.fixCostRandomScalar[1]))
         # Cap^(3/4) is intended to discount bigger pipelines (i.e. economies of scale)
         fixedCost = (randomDistanceComponent + self.capFixCostScale * capacity ** 0.75)
@@ -178,7 +182,7 @@ class GraphMaker:
     def calculateArcVariableCost(self, distance: float, capacity: int) -> float:
         """Calculates the variable cost of the arc in a pseudorandom manner"""
         # Pseudorandom component proportional to the distance the edge spans
-        randomDistanceComponent = (self.distVariableCostScale * distance * random.uniform(
+        randomDistanceComponent = (self.distVariableCostScale * distance * self.random.uniform(
             self.variableCostRandomScalar[0], self.variableCostRandomScalar[1]))
         # Cap^(3/4) is intended to discount bigger pipelines (i.e. economies of scale)
         variableCost = (randomDistanceComponent + self.capVariableCostScale * capacity ** 0.75)
@@ -190,23 +194,23 @@ class GraphMaker:
             self.newNetwork.isSourceSinkCapacitated = True
             tempSrcCaps = []
             for source in range(self.newNetwork.numSources):
-                thisSrcCap = random.randint(self.sourceSinkCapacityRange[0], self.sourceSinkCapacityRange[1])
+                thisSrcCap = self.random.randint(self.sourceSinkCapacityRange[0], self.sourceSinkCapacityRange[1])
                 tempSrcCaps.append(thisSrcCap)
             self.newNetwork.sourceCapsArray = np.array(tempSrcCaps)
             tempSinkCaps = []
             for sink in range(self.newNetwork.numSinks):
-                thisSinkCap = random.randint(self.sourceSinkCapacityRange[0], self.sourceSinkCapacityRange[1])
+                thisSinkCap = self.random.randint(self.sourceSinkCapacityRange[0], self.sourceSinkCapacityRange[1])
                 tempSinkCaps.append(thisSinkCap)
             self.newNetwork.sinkCapsArray = np.array(tempSinkCaps)
         if self.isSourceSinkCharged is True:
             self.newNetwork.isSourceSinkCharged = True
             tempSrcCosts = []
             for source in range(self.newNetwork.numSources):
-                thisSrcCost = random.uniform(self.sourceSinkChargeRange[0], self.sourceSinkChargeRange[1])
+                thisSrcCost = self.random.uniform(self.sourceSinkChargeRange[0], self.sourceSinkChargeRange[1])
                 tempSrcCosts.append(thisSrcCost)
             self.newNetwork.sourceVariableCostsArray = np.array(tempSrcCosts)
             tempSinkCosts = []
             for sink in range(self.newNetwork.numSinks):
-                thisSinkCost = random.uniform(self.sourceSinkChargeRange[0], self.sourceSinkChargeRange[1])
+                thisSinkCost = self.random.uniform(self.sourceSinkChargeRange[0], self.sourceSinkChargeRange[1])
                 tempSinkCosts.append(thisSinkCost)
             self.newNetwork.sinkVariableCostsArray = np.array(tempSinkCosts)
@@ -0,0 +1,11 @@
+import os
+
+from src.Network.FlowNetwork import FlowNetwork
+
+# Converts every legacy pickled network in the network instances directory to the compact npz format
+# NOTE: loadNetwork("<name>.p") reads "<name>.npz" once it exists, so the pickles may be deleted afterwards
+networkDir = os.path.join(os.getcwd(), "../networkInstances")
+for networkFile in sorted(os.listdir(networkDir)):
+    if networkFile.endswith(".p") and not os.path.exists(os.path.join(networkDir, networkFile[:-2] + ".npz")):
+        network = FlowNetwork.loadNetwork(networkFile)
+        network.saveNetwork(fileName=networkFile[:-2])  # NOTE: Some pickles hold a network named unlike their file
@@ -4,8 +4,9 @@ name = ""
 numNodes = 8
 numSources = 2
 numSinks = 2
+seed = None  # Set to an integer to rebuild the identical network
 
-graphMaker = GraphMaker(name, numNodes, numSources, numSinks)
+graphMaker = GraphMaker(name, numNodes, numSources, numSinks, seed=seed)
 # Uncomment to tune how the network generates costs and to turn on generalizations
 graphMaker.setCostDeterminingHyperparameters(possibleArcCaps=[100])
 graphMaker.setSourceSinkGeneralizations(True, True)
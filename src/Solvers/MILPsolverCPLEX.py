@@ -73,13 +73,8 @@ class MILPsolverCPLEX:
         # Source flow conservation
         for s in range(self.network.numSources):
             source = self.network.sourcesArray[s]
-            sourceObj = self.network.nodesDict[source]
-            outgoingIndexes = []
-            for edge in sourceObj.outgoingEdges:
-                outgoingIndexes.append(self.network.edgesDict[edge])
-            incomingIndexes = []
-            for edge in sourceObj.incomingEdges:
-                incomingIndexes.append(self.network.edgesDict[edge])
+            outgoingIndexes = self.network.getNodeOutgoingEdgeIndices(source)
+            incomingIndexes = self.network.getNodeIncomingEdgeIndices(source)
             ctName = "s_" + str(source) + "_Conserv"
             self.model.add_constraint(self.sourceFlowVars[s] ==
                                       sum(self.arcFlowVars[(m, n)] for m in outgoingIndexes
@@ -90,13 +85,8 @@ class MILPsolverCPLEX:
         # Sink flow conservation
         for t in range(self.network.numSinks):
             sink = self.network.sinksArray[t]
-            sinkObj = self.network.nodesDict[sink]
-            incomingIndexes = []
-            for edge in sinkObj.incomingEdges:
-                incomingIndexes.append(self.network.edgesDict[edge])
-            outgoingIndexes = []
-            for edge in sinkObj.outgoingEdges:
-                outgoingIndexes.append(self.network.edgesDict[edge])
+            incomingIndexes = self.network.getNodeIncomingEdgeIndices(sink)
+            outgoingIndexes = self.network.getNodeOutgoingEdgeIndices(sink)
             ctName = "t_" + str(sink) + "_Conserv"
             self.model.add_constraint(self.sinkFlowVars[t] ==
                                       sum(self.arcFlowVars[(m, n)] for m in incomingIndexes
@@ -107,13 +97,8 @@ class MILPsolverCPLEX:
         # Intermediate node flow conservation
         for n in range(self.network.numInterNodes):
             interNode = self.network.interNodesArray[n]
-            nodeObj = self.network.nodesDict[interNode]
-            incomingIndexes = []
-            for edge in nodeObj.incomingEdges:
-                incomingIndexes.append(self.network.edgesDict[edge])
-            outgoingIndexes = []
-            for edge in nodeObj.outgoingEdges:
-                outgoingIndexes.append(self.network.edgesDict[edge])
+            incomingIndexes = self.network.getNodeIncomingEdgeIndices(interNode)
+            outgoingIndexes = self.network.getNodeOutgoingEdgeIndices(interNode)
             ctName = "n_" + str(interNode) + "_Conserv"
             self.model.add_constraint(sum(self.arcFlowVars[(i, j)] for i in incomingIndexes
                                           for j in range(self.network.numArcCaps)) - sum(
@@ -122,33 +107,21 @@ class MILPsolverCPLEX:
                                       ctname=ctName)
 
         # =================== OBJECTIVE FUNCTION ===================
-        # NOTE: Borderline unreadable but verified correct
+        # NOTE: Arc number i * numArcCaps + j indexes the network's arc cost arrays directly
+        arcVariableCosts = self.network.arcToVariableCostArray
+        arcFixedCosts = self.network.arcToFixedCostArray
+        numArcCaps = self.network.numArcCaps
+        arcCosts = sum(self.arcFlowVars[(i, j)] * arcVariableCosts[i * numArcCaps + j] +
+                       self.arcOpenedVars[(i, j)] * arcFixedCosts[i * numArcCaps + j]
+                       for i in range(self.network.numEdges) for j in range(numArcCaps))
         if self.network.isSourceSinkCharged is True:
-            self.model.set_objective("min", sum(self.arcFlowVars[(i, j)]
-                                                * self.network.getArcVariableCostFromEdgeCapIndices(i, j)
-                                                for i in range(self.network.numEdges) for j in
-                                                range(self.network.numArcCaps)) + sum(self.arcOpenedVars[(m, n)] *
-                                                                                      self.network.getArcFixedCostFromEdgeCapIndices(
-                                                                                          m, n) for m in
-                                                                                      range(self.network.numEdges) for n
-                                                                                      in
-                                                                                      range(
-                                                                                          self.network.numArcCaps)) + sum(
+            self.model.set_objective("min", arcCosts + sum(
                 self.sourceFlowVars[s] * self.network.sourceVariableCostsArray[s] for s in
                 range(self.network.numSources)) +
                                      sum(self.sinkFlowVars[t] * self.network.sinkVariableCostsArray[t] for t in
                                          range(self.network.numSinks)))
         elif self.network.isSourceSinkCharged is False:
-            self.model.set_objective("min",
-                                     sum(self.arcFlowVars[(i, j)] * self.network.getArcVariableCostFromEdgeCapIndices(i,
-                                                                                                                      j)
-                                         for i in
-                                         range(self.network.numEdges) for j in
-                                         range(self.network.numArcCaps)) + sum(self.arcOpenedVars[(m, n)] *
-                                                                               self.network.getArcFixedCostFromEdgeCapIndices(
-                                                                                   m, n) for m in
-                                                                               range(self.network.numEdges) for n
-                                                                               in range(self.network.numArcCaps)))
+            self.model.set_objective("min", arcCosts)
 
     def solveModel(self) -> None:
         """Solves the MILP model in CPLEX"""
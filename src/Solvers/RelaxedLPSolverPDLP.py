@@ -74,13 +74,8 @@ class RelaxedLPSolverPDLP:
         # Source flow conservation
         for s in range(self.network.numSources):
             source = self.network.sourcesArray[s]
-            sourceObj = self.network.nodesDict[source]
-            outgoingIndexes = []
-            for edge in sourceObj.outgoingEdges:
-                outgoingIndexes.append(self.network.edgesDict[edge])
-            incomingIndexes = []
-            for edge in sourceObj.incomingEdges:
-                incomingIndexes.append(self.network.edgesDict[edge])
+            outgoingIndexes = self.network.getNodeOutgoingEdgeIndices(source)
+            incomingIndexes = self.network.getNodeIncomingEdgeIndices(source)
             varName = "s_" + str(s)
             self.solver.Add(self.solver.LookupVariable(varName) ==
                             sum(self.solver.LookupVariable("a_" + str(i) + "_" + str(c)) for i in
@@ -90,13 +85,8 @@ class RelaxedLPSolverPDLP:
         # Sink flow conservation
         for t in range(self.network.numSinks):
             sink = self.network.sinksArray[t]
-            sinkObj = self.network.nodesDict[sink]
-            incomingIndexes = []
-            for edge in sinkObj.incomingEdges:
-                incomingIndexes.append(self.network.edgesDict[edge])
-            outgoingIndexes = []
-            for edge in sinkObj.outgoingEdges:
-                outgoingIndexes.append(self.network.edgesDict[edge])
+            incomingIndexes = self.network.getNodeIncomingEdgeIndices(sink)
+            outgoingIndexes = self.network.getNodeOutgoingEdgeIndices(sink)
             varName = "t_" + str(t)
             self.solver.Add(self.solver.LookupVariable(varName) ==
                             sum(self.solver.LookupVariable("a_" + str(i) + "_" + str(c)) for i in
@@ -106,13 +96,8 @@ class RelaxedLPSolverPDLP:
         # Intermediate node flow conservation
         for n in range(self.network.numInterNodes):
             interNode = self.network.interNodesArray[n]
-            nodeObj = self.network.nodesDict[interNode]
-            incomingIndexes = []
-            for edge in nodeObj.incomingEdges:
-                incomingIndexes.append(self.network.edgesDict[edge])
-            outgoingIndexes = []
-            for edge in nodeObj.outgoingEdges:
-                outgoingIndexes.append(self.network.edgesDict[edge])
+            incomingIndexes = self.network.getNodeIncomingEdgeIndices(interNode)
+            outgoingIndexes = self.network.getNodeOutgoingEdgeIndices(interNode)
             name = "n_" + str(n) + "_Conserv"
             self.solver.Add(0 == sum(self.solver.LookupVariable("a_" + str(i) + "_" + str(c)) for i in
                                      incomingIndexes for c in range(self.network.numArcCaps)) -
@@ -123,25 +108,21 @@ class RelaxedLPSolverPDLP:
         """Updates the objective function based on the input alpha values"""
         # Clear any existing objective function
         self.solver.Objective().Clear()
-        # Write new objective function
+        # Write new objective function (NOTE: Arc number i * numArcCaps + j indexes the network's arc cost arrays directly)
+        arcVariableCosts = self.network.arcToVariableCostArray
+        arcFixedCosts = self.network.arcToFixedCostArray
+        numArcCaps = self.network.numArcCaps
+        arcCosts = sum(self.solver.LookupVariable("a_" + str(i) + "_" + str(j)) *
+                       (arcVariableCosts[i * numArcCaps + j] + arcFixedCosts[i * numArcCaps + j] * alphaValues[i][j])
+                       for i in range(self.network.numEdges) for j in range(numArcCaps))
         if self.network.isSourceSinkCharged is True:
-            self.solver.Minimize(
-                sum(self.solver.LookupVariable("a_" + str(i) + "_" + str(j)) * (
-                        self.network.getArcVariableCostFromEdgeCapIndices(i, j) +
-                        self.network.getArcFixedCostFromEdgeCapIndices(i, j) * alphaValues[i][j]) for i in
-                    range(self.network.numEdges)
-                    for j in range(self.network.numArcCaps)) + sum(
-                    self.solver.LookupVariable("s_" + str(s)) * self.network.sourceVariableCostsArray[s]
-                    for s in range(self.network.numSources)) + sum(
-                    self.solver.LookupVariable("t_" + str(t)) * self.network.sinkVariableCostsArray[t]
-                    for t in range(self.network.numSinks)))
+            self.solver.Minimize(arcCosts + sum(
+                self.solver.LookupVariable("s_" + str(s)) * self.network.sourceVariableCostsArray[s]
+                for s in range(self.network.numSources)) + sum(
+                self.solver.LookupVariable("t_" + str(t)) * self.network.sinkVariableCostsArray[t]
+                for t in range(self.network.numSinks)))
         elif self.network.isSourceSinkCharged is False:
-            self.solver.Minimize(
-                sum(self.solver.LookupVariable("a_" + str(i) + "_" + str(j)) * (
-                        self.network.getArcVariableCostFromEdgeCapIndices(i, j) +
-                        self.network.getArcFixedCostFromEdgeCapIndices(i, j) * alphaValues[i][j]) for i
-                    in range(self.network.numEdges)
-                    for j in range(self.network.numArcCaps)))
+            self.solver.Minimize(arcCosts)
 
     def solveModel(self) -> None:
         """Solves the alpha-relaxed LP model with PDLP"""
@@ -191,8 +172,8 @@ class RelaxedLPSolverPDLP:
         for edge in range(self.network.numEdges):
             for cap in range(self.network.numArcCaps):
                 if arcsOpen[(edge, cap)] == 1:
-                    arcVariableCost = self.network.getArcVariableCostFromEdgeCapIndices(edge, cap)
-                    arcFixedCost = self.network.getArcFixedCostFromEdgeCapIndices(edge, cap)
+                    arcVariableCost = self.network.arcToVariableCostArray[edge * self.network.numArcCaps + cap]
+                    arcFixedCost = self.network.arcToFixedCostArray[edge * self.network.numArcCaps + cap]
                     trueCost += arcVariableCost * arcFlows[(edge, cap)] + arcFixedCost
         return trueCost
 